@@ -1,15 +1,99 @@
+from functools import lru_cache
 from pathlib import Path
+import string
 import numpy as np
 
+from utils.linear.simple_pattern_generator import fill_pattern
+
+# Triple Word Score positions
+TW_POSITIONS = [
+    (0, 0), (0, 7), (0, 14),
+    (7, 0), (7, 14),
+    (14, 0), (14, 7), (14, 14)
+]
+
+# Double Word Score positions (including start square)
+DW_POSITIONS = [
+    (1, 1), (1, 13), (2, 2), (2, 12), (3, 3), (3, 11),
+    (4, 4), (4, 10), (7, 7),  # center square
+    (10, 4), (10, 10), (11, 3), (11, 11),
+    (12, 2), (12, 12), (13, 1), (13, 13)
+]
+
+# Triple Letter Score positions
+TL_POSITIONS = [
+    (1, 5), (1, 9), (5, 1), (5, 5), (5, 9), (5, 13),
+    (9, 1), (9, 5), (9, 9), (9, 13), (13, 5), (13, 9)
+]
+
+# Double Letter Score positions
+DL_POSITIONS = [
+    (0, 3), (0, 11), (2, 6), (2, 8), (3, 0), (3, 7), (3, 14),
+    (6, 2), (6, 6), (6, 8), (6, 12),
+    (7, 3), (7, 11),
+    (8, 2), (8, 6), (8, 8), (8, 12),
+    (11, 0), (11, 7), (11, 14), (12, 6), (12, 8),
+    (14, 3), (14, 11)
+]
+
+
+def _build_multiplier_grid(positions_by_value):
+    """Build a read-only 15x15 int8 grid of 1s with each {value: positions} entry set."""
+    grid = np.ones((15, 15), dtype=np.int8)
+    for value, positions in positions_by_value.items():
+        grid[tuple(zip(*positions))] = value
+    grid.flags.writeable = False
+    return grid
+
+
+# Define board scores for a standard 15x15 Scrabble board using NumPy arrays
+WORD_MULTIPLIER = _build_multiplier_grid({3: TW_POSITIONS, 2: DW_POSITIONS})
+LETTER_MULTIPLIER = _build_multiplier_grid({3: TL_POSITIONS, 2: DL_POSITIONS})
+
+
+def build_letter_points_table(letter_points):
+    """
+    Build a 256-entry int8 lookup table mapping a letter's code point to its points.
+
+    Indexing by code point matches Game.board_codes(), so a scorer can gather the
+    points of a whole run of board cells in one NumPy operation. Codes missing from
+    letter_points (including 0 for an empty cell and lowercase blanks) map to 0.
+    The table is read-only, like the multiplier grids.
+    """
+    table = np.zeros(256, dtype=np.int8)
+    for letter, points in letter_points.items():
+        table[ord(letter)] = points
+    table.flags.writeable = False
+    return table
+
+
 class Rule:
     def __init__(self, dictionary_path):
         file_path = Path(dictionary_path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"{file_path} not found.")
+        # Read the file in one go (no separate exists() probe) and hand its lines
+        # to the shared setup
+        try:
+            text = file_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{file_path} not found.") from None
+        self._init_from_words(text.splitlines())
+
+    @classmethod
+    def from_words(cls, words):
+        """Build a Rule straight from an iterable of words, without a dictionary file."""
+        rule = cls.__new__(cls)
+        rule._init_from_words(words)
+        return rule
 
-        with file_path.open('r', encoding='utf-8') as f:
-            # Strip each line and ignore empty lines
-            self.scrabble_dictionary = [line.strip() for line in f if line.strip()]
+    def _init_from_words(self, words):
+        # Strip/filter/lowercase through C-level map/filter calls. Stored as a lowercase
+        # frozenset so membership checks during move validation are O(1) instead of a
+        # list scan, and so the Rule shared by get_rule cannot be modified by a caller
+        self.scrabble_dictionary = frozenset(map(str.lower, filter(None, map(str.strip, words))))
+        # fill_letters answers keyed by (prefix, suffix), filled on demand for the
+        # dictionary object in _fill_words
+        self._fill_cache = {}
+        self._fill_words = self.scrabble_dictionary
             
         # Define letter points for standard Scrabble letters
         self.letter_points = {'-': 0, 'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1,
@@ -20,47 +104,72 @@ class Rule:
                               'K': 5,
                               'J': 8, 'X': 8,
                               'Q': 10, 'Z': 10}
+        # letter_points the letter_points_arr table was last built from
+        self._points_source = None
         
-        # Define board scores for a standard 15x15 Scrabble board using NumPy arrays
-        # Create score multiplier arrays (initialized with 1s)
-        self.word_multiplier = np.ones((15, 15), dtype=np.int8)
-        self.letter_multiplier = np.ones((15, 15), dtype=np.int8)
-        
-        # Set Triple Word Score positions
-        tw_positions = [
-            (0, 0), (0, 7), (0, 14),
-            (7, 0), (7, 14),
-            (14, 0), (14, 7), (14, 14)
-        ]
-        for row, col in tw_positions:
-            self.word_multiplier[row, col] = 3
-        
-        # Set Double Word Score positions (including start square)
-        dw_positions = [
-            (1, 1), (1, 13), (2, 2), (2, 12), (3, 3), (3, 11),
-            (4, 4), (4, 10), (7, 7),  # center square
-            (10, 4), (10, 10), (11, 3), (11, 11),
-            (12, 2), (12, 12), (13, 1), (13, 13)
-        ]
-        for row, col in dw_positions:
-            self.word_multiplier[row, col] = 2
-            
-        # Set Triple Letter Score positions
-        tl_positions = [
-            (1, 5), (1, 9), (5, 1), (5, 5), (5, 9), (5, 13),
-            (9, 1), (9, 5), (9, 9), (9, 13), (13, 5), (13, 9)
-        ]
-        for row, col in tl_positions:
-            self.letter_multiplier[row, col] = 3
-            
-        # Set Double Letter Score positions
-        dl_positions = [
-            (0, 3), (0, 11), (2, 6), (2, 8), (3, 0), (3, 7), (3, 14),
-            (6, 2), (6, 6), (6, 8), (6, 12),
-            (7, 3), (7, 11),
-            (8, 2), (8, 6), (8, 8), (8, 12),
-            (11, 0), (11, 7), (11, 14), (12, 6), (12, 8),
-            (14, 3), (14, 11)
-        ]
-        for row, col in dl_positions:
-            self.letter_multiplier[row, col] = 2
\ No newline at end of file
+        # Board multipliers are identical for every Rule, so share the read-only
+        # module-level grids instead of rebuilding them per instance
+        self.word_multiplier = WORD_MULTIPLIER
+        self.letter_multiplier = LETTER_MULTIPLIER
+
+    def __getstate__(self):
+        # Pickle only the words; everything else is derived from them and from this
+        # module's current definitions when the Rule is rebuilt on load
+        return {'scrabble_dictionary': self.scrabble_dictionary}
+
+    def __setstate__(self, state):
+        self._init_from_words(state['scrabble_dictionary'])
+
+    @property
+    def letter_points_arr(self):
+        """
+        letter_points as a build_letter_points_table lookup table, indexed by code point
+        for vectorized lookups on the board codes. Rebuilt when letter_points is edited.
+        """
+        if self.letter_points != self._points_source:
+            self._points_arr = build_letter_points_table(self.letter_points)
+            self._points_source = dict(self.letter_points)
+        return self._points_arr
+
+    def fill_letters(self, prefix, suffix):
+        """
+        Return the letters ch for which prefix + ch + suffix is a dictionary word.
+
+        This is the question asked for every wildcard with a cross word, and the same
+        cross words come up again and again while the optimisers validate candidate
+        moves against one board, so answers are memoized per (prefix, suffix). Letters
+        are returned as an uppercase frozenset. The memo is dropped when
+        scrabble_dictionary is reassigned.
+        """
+        if self._fill_words is not self.scrabble_dictionary:
+            self._fill_cache = {}
+            self._fill_words = self.scrabble_dictionary
+        key = (prefix.lower(), suffix.lower())
+        letters = self._fill_cache.get(key)
+        if letters is None:
+            prefix, suffix = key
+            letters = frozenset(ch.upper() for ch in string.ascii_lowercase
+                                if prefix + ch + suffix in self.scrabble_dictionary)
+            self._fill_cache[key] = letters
+        return letters
+
+    def fill_pattern(self, pattern):
+        """
+        Return the letters that fill the '_' slots of pattern to make a dictionary word.
+
+        The counterpart of fill_letters for words with several open cells (a move
+        placing more than one blank), answered from the dictionary's length index
+        shared with SimplePatternGenerator. Returns a sorted list of tuples of
+        uppercase letters, one per slot in order.
+        """
+        return fill_pattern(self.scrabble_dictionary, pattern)
+
+
+@lru_cache(maxsize=None)
+def get_rule(dictionary_path):
+    """
+    Return a Rule for dictionary_path, parsing each dictionary file only once per process.
+
+    The Rule is shared between callers, so treat it as read-only.
+    """
+    return Rule(dictionary_path)
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from resources.rule_definitions import Rule
+from utils.matrix.game_state import Game
+
+# Words the scoring tests play. Scoring never consults the dictionary, so one
+# rule covers every scoring test class
+SCORE_TEST_WORDS = [
+    'quite', 'mesquite', 'mes', 'infancy', 'qi', 'un', 'if', 'ta', 'en',
+    'recounts', 'cat', 'cats', 'at', 'a', 'dog', 'dogs', 'test', 'word', 'words',
+    'score', 'bingo', 'example', 'quiz', 'quizzes', 'jazz', 'fizz', 'buzz', 'zippy',
+    'zephyr', 'ax', 'ox', 'xi', 'xu', 'za', 'qat', 'qua', 'jo', 'ka', 'ki',
+    'hello', 'world', 'python', 'code', 'game', 'play', 'tile'
+]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--quiet-scrabble", action="store_true", default=False,
+        help="silence the recommendation tests' board and move printouts (sets SCRABBLE_QUIET)",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--quiet-scrabble"):
+        os.environ['SCRABBLE_QUIET'] = '1'
+
+
+@pytest.fixture(scope="session")
+def score_rule():
+    """Standard rules with the scoring tests' dictionary, built once per session"""
+    return Rule.from_words(SCORE_TEST_WORDS)
+
+
+@pytest.fixture
+def setup_game(score_rule):
+    """Setup a fresh game with standard rules and a test dictionary"""
+    return Game(score_rule)
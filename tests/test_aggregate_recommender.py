@@ -1,5 +1,6 @@
 import os
 import sys
+from operator import itemgetter
 import numpy as np
 
 # Ensure project root on path
@@ -7,9 +8,10 @@ ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from resources.rule_definitions import Rule
+from resources.rule_definitions import Rule, get_rule
 from utils.players.aggregate_recommender import AggregateRecommender
-from utils.matrix.game_state import Game
+from utils.matrix.game_state import Game, cells_text
+from utils.matrix.board_scan import collect_runs
 
 
 def _print_moves_dict(game: Game, moves_dict, limit=10):
@@ -20,12 +22,14 @@ def _print_moves_dict(game: Game, moves_dict, limit=10):
         if not moves:
             continue
         for i, (adds, score) in enumerate(moves[:limit], start=1):
-            word_positions = sorted(adds, key=lambda x: (x[1][0], x[1][1]))
-            word = ''.join(ch.upper() for ch, _ in word_positions)
+            word_positions = sorted(adds, key=itemgetter(1))  # [row, col] lists compare row-major
+            word = ''.join(ch for ch, _ in word_positions).upper()
             positions = [(pos[0], pos[1]) for _, pos in word_positions]
+            # positions are sorted by (row, col), so equal end rows mean a single row
+            cols = [p[1] for p in positions]
             direction = (
-                'Horizontal' if len(set(p[0] for p in positions)) == 1 else
-                'Vertical' if len(set(p[1] for p in positions)) == 1 else
+                'Horizontal' if positions[0][0] == positions[-1][0] else
+                'Vertical' if min(cols) == max(cols) else
                 'Mixed'
             )
             print(f"    {i}. {word} ({direction}) - Score: {score}")
@@ -37,36 +41,13 @@ def _print_moves_dict(game: Game, moves_dict, limit=10):
 
 def _collect_board_words(game: Game):
     """Collect all contiguous horizontal and vertical words (len>=2) currently on the board."""
-    words = set()
+    found = []
     b = game.board
-    # Horizontal scan
-    for r in range(15):
-        c = 0
-        while c < 15:
-            if b[r, c] == '':
-                c += 1
-                continue
-            start = c
-            while c < 15 and b[r, c] != '':
-                c += 1
-            word = ''.join(b[r, start:c])
-            if len(word) >= 2:
-                words.add(word.lower())
-        
-    # Vertical scan
-    for c in range(15):
-        r = 0
-        while r < 15:
-            if b[r, c] == '':
-                r += 1
-                continue
-            start = r
-            while r < 15 and b[r, c] != '':
-                r += 1
-            word = ''.join(b[start:r, c])
-            if len(word) >= 2:
-                words.add(word.lower())
-    return sorted(words)
+    for axis, line, s, e in collect_runs(game.board_codes(), 2):
+        cells = b[line, s:e] if axis == 0 else b[s:e, line]
+        found.append(cells_text(cells).lower())
+    # dict.fromkeys dedups in C while keeping a plain list during the scans
+    return sorted(dict.fromkeys(found))
 
 
 def _validate_board_words(rule: Rule, game: Game):
@@ -80,7 +61,7 @@ def _run_case(title, setup_board_fn, deck):
     print("=" * 100)
     print(title)
     print("=" * 100)
-    rule = Rule('resources/twl06_scrabble_dic_american.txt')
+    rule = get_rule('resources/twl06_scrabble_dic_american.txt')
     game = Game(rule)
     setup_board_fn(game)
 
@@ -123,7 +104,7 @@ def test_agg_empty_board_no_moves():
 def test_agg_single_word_extension():
     deck = list('AEINRTS')
     def setup(game: Game):
-        game.board[7, 6:10] = list('STAR')
+        game.place_word(7, 6, 'H', 'STAR')
     _run_case("AGG TEST 3: Non-Empty - Single Existing Word Extension", setup, deck)
 
 
@@ -132,12 +113,10 @@ def test_agg_crossword_opportunity():
     def setup(game: Game):
         # Valid existing words: "TO" horizontal and "AT" vertical crossing the 'T', plus vertical "ION".
         # Place horizontal TO at (7,7)-(7,8).
-        game.board[7, 7:9] = list('TO')
-        # Place 'A' above 'T' to form vertical AT.
-        game.board[6, 7] = 'A'
-        # Create vertical ION using the O at (7,8): I at (6,8), O at (7,8), N at (8,8).
-        game.board[6, 8] = 'I'
-        game.board[8, 8] = 'N'
+        game.place_word(7, 7, 'H', 'TO')
+        # Place 'A' above 'T' to form vertical AT, and create vertical ION using
+        # the O at (7,8): I at (6,8), O at (7,8), N at (8,8).
+        game.board[[6, 6, 8], [7, 8, 8]] = list('AIN')
     _run_case("AGG TEST 4: Non-Empty - Crossword Opportunities (Valid words: TO, AT, ION)", setup, deck)
 
 
@@ -147,30 +126,29 @@ def test_agg_dense_channel():
         # Use two long valid words as dense bands leaving corridor cells for new plays.
         # Row 6: CONSTRAINTS (11 letters) across columns 2..12.
         word1 = 'CONSTRAINTS'
-        game.board[6, 2:13] = list(word1)
+        game.place_word(6, 2, 'H', word1)
         # Row 8: PREDICTIONS (11 letters) across columns 2..12.
         word2 = 'PREDICTIONS'
-        game.board[8, 2:13] = list(word2)
+        game.place_word(8, 2, 'H', word2)
         # Provide anchor letters that form valid vertical words with surrounding letters.
         # At col4 (between N and E) place 'A' -> forms NAE (valid in TWL06).
-        game.board[7, 4] = 'A'
         # At col8 (between A and T) place 'N' -> forms ANT (valid).
-        game.board[7, 8] = 'N'
+        game.board[[7, 7], [4, 8]] = list('AN')
     _run_case("AGG TEST 5: Non-Empty - Dense Bands (CONSTRAINTS / PREDICTIONS) with Anchors", setup, deck)
 
 
 def test_agg_no_moves_nonempty():
     deck = list('QZZZZQZ')
     def setup(game: Game):
-        game.board[7, 6:10] = list('STAR')
+        game.place_word(7, 6, 'H', 'STAR')
     _run_case("AGG TEST 6: Non-Empty - Likely No Moves with Hard Deck", setup, deck)
 
 
 def test_agg_wildcard_usage():
     deck = list('A-EINRT')
     def setup(game: Game):
-        game.board[7, 6:10] = list('STAR')
-        game.board[5:9, 12] = list('MEAN')
+        game.place_word(7, 6, 'H', 'STAR')
+        game.place_word(5, 12, 'V', 'MEAN')
     _run_case("AGG TEST 7: Non-Empty - Wildcard Deck", setup, deck)
 
 
@@ -121,6 +121,30 @@ def test_check_board_valid_requires_touch():
         game._check_board_valid(additions)
 
 
+def test_check_board_valid_off_board_addition_must_connect():
+    rule = TestRule()
+    game = Game(rule)
+    game.board[6, 14] = 'A'
+    game.board[14, 6] = 'A'
+    for pos in ([7, 15], [15, 7], [7, -1], [-1, 7]):
+        with pytest.raises(ValueError, match="New letters must connect to existing words"):
+            game._check_board_valid([('B', pos)])
+
+
+def test_touches_existing_word_ignores_off_board_tiles():
+    rule = TestRule()
+    game = Game(rule)
+    game.board[6, 14] = 'A'
+    game.board[14, 6] = 'A'
+    # Off-board tiles must neither raise nor wrap around to row/column 14
+    assert game._touches_existing_word([('B', [7, 15])]) is False
+    assert game._touches_existing_word([('B', [15, 7])]) is False
+    assert game._touches_existing_word([('B', [7, -1])]) is False
+    assert game._touches_existing_word([('B', [-1, 7])]) is False
+    # An on-board tile of the same move is still probed
+    assert game._touches_existing_word([('B', [7, -1]), ('C', [7, 14])]) is True
+
+
 def test_print_board_runs():
     rule = TestRule()
     game = Game(rule)
@@ -7,13 +7,13 @@ ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from resources.rule_definitions import Rule
+from resources.rule_definitions import get_rule
 from utils.players.longest_word import OptimiserLength
 
 def test_multi_patterns():
     """Test that multiple patterns are generated when blocks exist on both sides"""
     
-    rule = Rule('resources/twl06_scrabble_dic_american.txt')
+    rule = get_rule('resources/twl06_scrabble_dic_american.txt')
     optimizer = OptimiserLength(rule)
     
     # Test Case 1: Blocks on both sides with 7-letter rack
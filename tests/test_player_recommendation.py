@@ -1,19 +1,25 @@
+import copy
 import os
 import sys
 import numpy as np
+import pytest
 
 # Ensure project root is on sys.path when running this file directly
 ROOT = os.path.dirname(os.path.dirname(__file__))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from resources.rule_definitions import Rule
+from resources.rule_definitions import get_rule
 from utils.players.longest_word import OptimiserLength
 from utils.players.prized_cells import OptimiserPrize
 from utils.players.crossword import OptimiserCrossword
+from utils.players.move import Move
 from utils.matrix.game_state import Game
 
 
+# Set SCRABBLE_QUIET (or pass --quiet-scrabble to pytest) to skip all output, e.g. when timing
+_VERBOSE = not os.environ.get('SCRABBLE_QUIET')
+
 PLAYERS = {
     'LongestWord': lambda rule, game: OptimiserLength(rule, game),
     'PrizeCells': lambda rule, game: OptimiserPrize(rule, game),
@@ -21,202 +27,183 @@ PLAYERS = {
 }
 
 
-def _print_additions(game, additions_list, limit=10, prefix=""):
-    """Print additions where each item is a tuple (adds, score)."""
+def _write_lines(lines):
+    """Write collected output lines with a single stdout write."""
+    if not _VERBOSE:
+        return
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _print_additions(game, additions_list, limit=10, prefix="", out=None):
+    """
+    Print additions where each item is a Move (adds, score).
+
+    Lines are appended to out when a list is given, otherwise written in one go.
+    """
+    lines = [] if out is None else out
     if prefix:
-        print(prefix)
-    print(f"  Found {len(additions_list)} move(s):")
-    for i, (adds, score) in enumerate(additions_list[:limit], 1):
-        word_positions = sorted(adds, key=lambda x: (x[1][0], x[1][1]))
-        word = ''.join(ch.upper() for ch, _ in word_positions)
-        positions = [(pos[0], pos[1]) for _, pos in word_positions]
+        lines.append(prefix)
+    lines.append(f"  Found {len(additions_list)} move(s):")
+    for i, move in enumerate(additions_list[:limit], 1):
+        adds, score = move
+        word = move.word
+        positions = move.positions
         try:
+            # positions are sorted by (row, col), so equal end rows mean a single row
+            cols = [p[1] for p in positions]
             direction = (
-                'Horizontal' if len(set(p[0] for p in positions)) == 1 else
-                'Vertical' if len(set(p[1] for p in positions)) == 1 else
+                'Horizontal' if positions[0][0] == positions[-1][0] else
+                'Vertical' if min(cols) == max(cols) else
                 'Mixed'
             )
-            print(f"\n    Move {i}: {word} ({direction}) - Score: {score}")
-            print(f"    Positions: {positions}")
-            print(f"    Additions: {adds}")
+            lines.append(f"\n    Move {i}: {word} ({direction}) - Score: {score}")
+            lines.append(f"    Positions: {positions}")
+            lines.append(f"    Additions: {adds}")
         except Exception as e:
-            print(f"\n    Move {i}: Error scoring - {e}")
+            lines.append(f"\n    Move {i}: Error scoring - {e}")
     if len(additions_list) > limit:
-        print(f"\n    ... and {len(additions_list) - limit} more moves")
+        lines.append(f"\n    ... and {len(additions_list) - limit} more moves")
+    if out is None:
+        _write_lines(lines)
 
 
-def _run_players_on_case(title, setup_board_fn, deck):
-    print("="*100)
-    print(title)
-    print("="*100)
-    rule = Rule('resources/twl06_scrabble_dic_american.txt')
+def _run_players_on_case(title, setup_board_fn, deck, players=None):
+    """Print the board and each player's recommendations; players defaults to all of PLAYERS."""
+    rule = get_rule('resources/twl06_scrabble_dic_american.txt')
 
-    # Prepare per-player games with identical boards
-    games = {name: Game(rule) for name in PLAYERS}
-    for name, game in games.items():
-        setup_board_fn(game)
+    # Set the board up once; each player gets a copy sharing the same rule
+    base_game = Game(rule)
+    setup_board_fn(base_game)
 
-    # Print shared board and deck once (use one of the games)
-    any_game = next(iter(games.values()))
-    print(f"Deck: {deck}")
-    print("\nBoard state:")
-    any_game.print_board()
+    # Print shared board and deck once
+    _write_lines(["="*100, title, "="*100, f"Deck: {deck}", "\nBoard state:"])
+    if _VERBOSE:
+        base_game.print_board()
 
-    print("\nRecommendations by player:")
-    for name, game in games.items():
+    # Collect every player's output and write it once at the end
+    out = ["\nRecommendations by player:"]
+    for name in (players if players is not None else PLAYERS):
+        game = copy.copy(base_game)
         optimiser = PLAYERS[name](rule, game)
         try:
             rec = optimiser.recommend_next_move(deck)
         except Exception as e:
-            print(f"- {name}: Error during recommendation: {e}")
+            out.append(f"- {name}: Error during recommendation: {e}")
             continue
         
         # Empty result
         if not rec:
-            print(f"- {name}: No valid moves found.")
+            out.append(f"- {name}: No valid moves found.")
             continue
             
-        # Check if it's a list of words (strings) - LongestWord empty board case
-        if isinstance(rec[0], str):
+        # Players return a list of Move; only LongestWord on an empty board returns start words
+        if isinstance(rec[0], Move):
+            _print_additions(game, rec, limit=10, prefix=f"- {name}:", out=out)
+        else:
             base_len = len(rec[0])
-            print(f"- {name}: {len(rec)} candidate word(s) of length {base_len} (showing up to 10):")
+            out.append(f"- {name}: {len(rec)} candidate word(s) of length {base_len} (showing up to 10):")
             for i, w in enumerate(rec[:10], 1):
-                print(f"    {i}. {w}")
+                out.append(f"    {i}. {w}")
             if len(rec) > 10:
-                print(f"    ... and {len(rec) - 10} more")
-        # List of (additions, score) tuples
-        elif isinstance(rec[0], tuple) and len(rec[0]) == 2:
-            # rec is a list of (additions, score) tuples
-            if isinstance(rec[0][0], list):
-                _print_additions(game, rec, limit=10, prefix=f"- {name}:")
-            else:
-                print(f"- {name}: Unexpected tuple format -> {rec[0]}")
-        else:
-            print(f"- {name}: Unexpected output format -> {type(rec)}: {rec}")
-    print()
+                out.append(f"    ... and {len(rec) - 10} more")
+    out.append('')
+    _write_lines(out)
 
 
-def test_empty_board():
-    deck = list('AEINRST')
-    def setup(game: Game):
-        pass  # empty board
-    _run_players_on_case("TEST 1: Empty Board Opening", setup, deck)
+def _setup_empty_board(game: Game):
+    pass  # empty board
 
 
-def test_single_word_extension():
-    deck = list('AEINRTS')
-    def setup(game: Game):
-        game.board[7, 6:10] = list('STAR')
-    _run_players_on_case("TEST 2: Single Existing Word - Extension", setup, deck)
+def _setup_single_word_extension(game: Game):
+    game.place_word(7, 6, 'H', 'STAR')
 
 
-def test_interlocking_words():
-    deck = list('INGBLEO')
-    def setup(game: Game):
-        game.board[7, 6:10] = list('STAR')
-        game.board[5:9, 9] = list('RATE')
-    _run_players_on_case("TEST 3: Interlocking Words Scenario", setup, deck)
+def _setup_interlocking_words(game: Game):
+    game.place_word(7, 6, 'H', 'STAR')
+    game.place_word(5, 9, 'V', 'RATE')
 
 
-def test_blank_tile_usage():
-    deck = list('AEIO-RS')
-    def setup(game: Game):
-        game.board[7, 6:9] = list('CAT')
-    _run_players_on_case("TEST 4: Blank Tile Usage", setup, deck)
+def _setup_blank_tile_usage(game: Game):
+    game.place_word(7, 6, 'H', 'CAT')
 
 
-def test_crowded_board():
-    deck = list('ABCDEFG')
-    def setup(game: Game):
-        game.board[7, 4:8] = list('WORD')
-        game.board[7, 10:14] = list('PLAY')
-        game.board[5:9, 7] = list('DEAR')
-        game.board[9:13, 7] = list('ZEST')
-    _run_players_on_case("TEST 5: Crowded Board - Limited Spaces", setup, deck)
+def _setup_crowded_board(game: Game):
+    game.place_word(7, 4, 'H', 'WORD')
+    game.place_word(7, 10, 'H', 'PLAY')
+    game.place_word(5, 7, 'V', 'DEAR')
+    game.place_word(9, 7, 'V', 'ZEST')
 
 
-def test_high_multiplier_focus():
-    deck = list('TOLINE-')
-    def setup(game: Game):
-        game.board[7,7] = 'A'
-        game.board[7,6] = 'R'
-        game.board[6,7] = 'E'
-    _run_players_on_case("TEST 6: High Multiplier Focus (Multiple prized targets)", setup, deck)
+def _setup_high_multiplier_focus(game: Game):
+    game.board[[7, 7, 6], [7, 6, 7]] = list('ARE')
 
 
-def test_no_valid_moves():
+def _setup_no_valid_moves(game: Game):
     """Test case where no valid moves can be formed (impossible deck/board combo)"""
-    deck = list('ZZZQQQX')  # Very constrained letters
-    def setup(game: Game):
-        # Create a board with limited anchor opportunities and words that don't work with the deck
-        game.board[7, 7] = 'A'
-        game.board[7, 8] = 'B'
-        game.board[7, 9] = 'C'
-        game.board[8, 7] = 'D'
-        game.board[9, 7] = 'E'
-        game.board[6, 7] = 'F'
-        # Anchors exist but deck letters can't form valid words with these fixed letters
-    _run_players_on_case("TEST 7: No Valid Moves (Impossible Deck)", setup, deck)
-
-
-def test_dense_midboard_corridors():
+    # Create a board with limited anchor opportunities and words that don't work with the deck
+    game.board[[7, 7, 7, 8, 9, 6], [7, 8, 9, 7, 7, 7]] = list('ABCDEF')
+    # Anchors exist but deck letters can't form valid words with these fixed letters
+
+
+def _setup_dense_midboard_corridors(game: Game):
     """Dense mid-board with multiple lanes around a vertical column to create tight placement corridors."""
-    deck = list('EIRSTLA')
-    def setup(game: Game):
-        # Two parallel horizontals
-        game.board[6, 3:9] = list('STREAM')   # row 6, cols 3-8
-        game.board[8, 3:9] = list('PLANER')   # row 8, cols 3-8
-        # A vertical nearby creating side corridors (no intersection with above)
-        game.board[5:10, 10] = list('ROTOR')  # col 10, rows 5-9
-    _run_players_on_case("TEST 8: Dense Mid-board Corridors", setup, deck)
+    # Two parallel horizontals
+    game.place_word(6, 3, 'H', 'STREAM')   # row 6, cols 3-8
+    game.place_word(8, 3, 'H', 'PLANER')   # row 8, cols 3-8
+    # A vertical nearby creating side corridors (no intersection with above)
+    game.place_word(5, 10, 'V', 'ROTOR')  # col 10, rows 5-9
 
 
-def test_edge_premium_snipes():
+def _setup_edge_premium_snipes(game: Game):
     """Crowded near the right edge to encourage premium-square snipes and edge-fitting plays."""
-    deck = list('AXLESR-')
-    def setup(game: Game):
-        # Horizontal hugging the right edge
-        game.board[7, 10:15] = list('AXLES')  # row 7, cols 10-14
-        # Vertical nearby to add anchors
-        game.board[4:9, 9] = list('REEDS')    # col 9, rows 4-8
-    _run_players_on_case("TEST 9: Edge Premium Snipes", setup, deck)
+    # Horizontal hugging the right edge
+    game.place_word(7, 10, 'H', 'AXLES')  # row 7, cols 10-14
+    # Vertical nearby to add anchors
+    game.place_word(4, 9, 'V', 'REEDS')    # col 9, rows 4-8
 
 
-def test_double_row_channels():
+def _setup_double_row_channels(game: Game):
     """Two dense horizontal rows with a clear row in between: invites cross placements bridging both."""
-    deck = list('HOOKING')
-    def setup(game: Game):
-        game.board[6, 4:9] = list('RANGE')    # row 6, cols 4-8
-        game.board[8, 4:9] = list('TONES')    # row 8, cols 4-8
-        # Add a separate vertical column to increase anchors (avoid overlapping conflicts)
-        game.board[5:11, 12] = list('LADDER') # col 12, rows 5-10
-    _run_players_on_case("TEST 10: Double Row Channels (Bridge Opportunities)", setup, deck)
+    game.place_word(6, 4, 'H', 'RANGE')    # row 6, cols 4-8
+    game.place_word(8, 4, 'H', 'TONES')    # row 8, cols 4-8
+    # Add a separate vertical column to increase anchors (avoid overlapping conflicts)
+    game.place_word(5, 12, 'V', 'LADDER') # col 12, rows 5-10
 
 
-def test_staggered_bands():
+def _setup_staggered_bands(game: Game):
     """Staggered bands of letters across three rows to force constrained interlocks and hooks."""
-    deck = list('RETURNS')
-    def setup(game: Game):
-        game.board[5, 3:10] = list('SILENCE')   # row 5, cols 3-9
-        game.board[7, 3:10] = list('HUMMERS')   # row 7, cols 3-9
-        # Add a couple of isolated hooks on the middle row
-        game.board[6, 2] = 'A'
-        game.board[6, 10] = 'B'
-    _run_players_on_case("TEST 11: Staggered Bands with Side Hooks", setup, deck)
+    game.place_word(5, 3, 'H', 'SILENCE')   # row 5, cols 3-9
+    game.place_word(7, 3, 'H', 'HUMMERS')   # row 7, cols 3-9
+    # Add a couple of isolated hooks on the middle row
+    game.board[[6, 6], [2, 10]] = list('AB')
+
+
+# (title, board setup, deck) for every scenario, each run against every player
+CASES = [
+    ("TEST 1: Empty Board Opening", _setup_empty_board, list('AEINRST')),
+    ("TEST 2: Single Existing Word - Extension", _setup_single_word_extension, list('AEINRTS')),
+    ("TEST 3: Interlocking Words Scenario", _setup_interlocking_words, list('INGBLEO')),
+    ("TEST 4: Blank Tile Usage", _setup_blank_tile_usage, list('AEIO-RS')),
+    ("TEST 5: Crowded Board - Limited Spaces", _setup_crowded_board, list('ABCDEFG')),
+    ("TEST 6: High Multiplier Focus (Multiple prized targets)", _setup_high_multiplier_focus, list('TOLINE-')),
+    ("TEST 7: No Valid Moves (Impossible Deck)", _setup_no_valid_moves, list('ZZZQQQX')),  # Very constrained letters
+    ("TEST 8: Dense Mid-board Corridors", _setup_dense_midboard_corridors, list('EIRSTLA')),
+    ("TEST 9: Edge Premium Snipes", _setup_edge_premium_snipes, list('AXLESR-')),
+    ("TEST 10: Double Row Channels (Bridge Opportunities)", _setup_double_row_channels, list('HOOKING')),
+    ("TEST 11: Staggered Bands with Side Hooks", _setup_staggered_bands, list('RETURNS')),
+]
+
+
+@pytest.mark.parametrize("player_name", list(PLAYERS))
+@pytest.mark.parametrize("title,setup_board_fn,deck", CASES,
+                         ids=[setup.__name__[len('_setup_'):] for _, setup, _ in CASES])
+def test_player_recommendation(title, setup_board_fn, deck, player_name):
+    _run_players_on_case(title, setup_board_fn, deck, players=[player_name])
 
 
 if __name__ == '__main__':
-    test_empty_board()
-    test_single_word_extension()
-    test_interlocking_words()
-    test_blank_tile_usage()
-    test_crowded_board()
-    test_high_multiplier_focus()
-    test_no_valid_moves()
-    test_dense_midboard_corridors()
-    test_edge_premium_snipes()
-    test_double_row_channels()
-    test_staggered_bands()
+    for title, setup_board_fn, deck in CASES:
+        _run_players_on_case(title, setup_board_fn, deck)
     print("="*100)
     print("All player recommendation tests complete!")
     print("="*100)
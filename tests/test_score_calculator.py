@@ -11,34 +11,14 @@ References:
 
 import pytest
 import numpy as np
-from pathlib import Path
-from utils.matrix.game_state import Game
+
 from resources.rule_definitions import Rule
+from utils.matrix.game_state import Game
 
 
 class TestScoreCalculator:
     """Test cases for Scrabble score calculation based on real examples"""
     
-    @pytest.fixture
-    def setup_game(self):
-        """Setup a fresh game with standard rules and a test dictionary"""
-        # Create a comprehensive test dictionary
-        test_words = [
-            'quite', 'mesquite', 'mes', 'infancy', 'qi', 'un', 'if', 'ta', 'en',
-            'recounts', 'cat', 'dog', 'test', 'word', 'score', 'bingo', 'example',
-            'quiz', 'quizzes', 'jazz', 'fizz', 'buzz', 'zippy', 'zephyr',
-            'ax', 'ox', 'xi', 'xu', 'za', 'qi', 'qat', 'qua', 'jo', 'ka', 'ki',
-            'hello', 'world', 'python', 'code', 'test', 'game', 'play', 'tile'
-        ]
-        dictionary_path = Path(__file__).parent.parent / 'resources' / 'test_dictionary.txt'
-        dictionary_path.parent.mkdir(exist_ok=True)
-        with open(dictionary_path, 'w') as f:
-            f.write('\n'.join(test_words))
-        
-        rule = Rule(str(dictionary_path))
-        game = Game(rule)
-        return game
-    
     def test_simple_word_no_multipliers(self, setup_game):
         """
         Test: Simple word with no premium squares
@@ -416,6 +396,16 @@ class TestScoreCalculator:
         score = game._score_calculator(additions, bingo=True)
         expected = 3 + 1 + 1 + 50  # C+A+T + bingo bonus = 55
         assert score == expected, f"Expected {expected} (forced bingo), got {score}"
+
+    def test_truthy_bingo_flag(self, setup_game):
+        """
+        Test: any truthy bingo value adds the 50-point bonus exactly once
+        """
+        game = setup_game
+        additions = [('C', [8, 9]), ('A', [8, 10]), ('T', [8, 11])]
+        for bingo in (2, 'yes'):
+            score = game._score_calculator(additions, bingo=bingo)
+            assert score == 3 + 1 + 1 + 50, f"bingo={bingo!r}: got {score}"
     
     def test_quiz_high_score(self, setup_game):
         """
@@ -464,23 +454,60 @@ class TestScoreCalculator:
         expected = 3 + 1 + 1  # Whole word CAT
         assert score == expected, f"Expected {expected}, got {score}"
 
+    def test_edited_letter_points(self):
+        """
+        Test: Edits to a rule's letter_points dict are used by later scores
+        """
+        rule = Rule.from_words(['cat'])
+        game = Game(rule)
+        additions = [('C', [8, 9]), ('A', [8, 10]), ('T', [8, 11])]
+        assert game._score_calculator(additions) == 3 + 1 + 1
+
+        rule.letter_points['C'] = 4
+        assert game._score_calculator(additions) == 4 + 1 + 1
+        assert game.score_batch([additions]).tolist() == [4 + 1 + 1]
+
+    def test_score_batch_rejects_malformed_moves(self, setup_game):
+        """
+        Test: score_batch marks moves it cannot score with -1 instead of failing
+        Off-board tiles (either edge) and non-single-character tiles score -1, an
+        empty move scores 0, and the valid moves around them score as usual.
+        """
+        game = setup_game
+        cat = [('C', [8, 9]), ('A', [8, 10]), ('T', [8, 11])]
+        batch = [
+            cat,
+            [('C', [8, 13]), ('A', [8, 14]), ('T', [8, 15])],
+            [('A', [-1, 9]), ('T', [0, 9])],
+            [('AT', [8, 9])],
+            [],
+            [('S', [8, 12])],
+        ]
+        scores = game.score_batch(batch)
+        assert scores.tolist() == [game._score_calculator(cat), -1, -1, -1, 0,
+                                   game._score_calculator([('S', [8, 12])])]
+
+    def test_score_batch_matches_score_calculator(self, setup_game):
+        """
+        Test: score_batch scores blanks and 7-tile bingos like _score_calculator
+        """
+        game = setup_game
+        game._update([('C', [7, 7]), ('A', [7, 8]), ('T', [7, 9])])
+        blank = [('c', [1, 1]), ('A', [1, 2]), ('T', [1, 3])]
+        blank_cross = [('s', [7, 10])]
+        bingo = [('E', [9, 2]), ('X', [9, 3]), ('A', [9, 4]), ('M', [9, 5]),
+                 ('P', [9, 6]), ('L', [9, 7]), ('E', [9, 8])]
+        bingo_with_blank = [('E', [9, 2]), ('x', [9, 3]), ('A', [9, 4]), ('M', [9, 5]),
+                            ('P', [9, 6]), ('L', [9, 7]), ('E', [9, 8])]
+        batch = [blank, blank_cross, bingo, bingo_with_blank]
+        expected = [game._score_calculator(adds) for adds in batch]
+        assert game.score_batch(batch).tolist() == expected
+        assert expected[2] > 50 and expected[3] > 50
+
 
 class TestIntegration:
     """Integration tests for score calculator"""
     
-    @pytest.fixture
-    def setup_game(self):
-        """Setup a fresh game with standard rules and a test dictionary"""
-        test_words = ['word', 'words', 'cat', 'cats']
-        dictionary_path = Path(__file__).parent.parent / 'resources' / 'test_dictionary_integration.txt'
-        dictionary_path.parent.mkdir(exist_ok=True)
-        with open(dictionary_path, 'w') as f:
-            f.write('\n'.join(test_words))
-        
-        rule = Rule(str(dictionary_path))
-        game = Game(rule)
-        return game
-    
     def test_score_calculator_integration(self, setup_game):
         """
         Integration test: Simulate a multi-turn game
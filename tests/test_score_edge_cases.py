@@ -6,27 +6,11 @@ These tests check for potential issues and edge cases in the scoring implementat
 
 import pytest
 import numpy as np
-from pathlib import Path
-from utils.matrix.game_state import Game
-from resources.rule_definitions import Rule
 
 
 class TestScoreEdgeCases:
     """Test edge cases and potential scoring issues"""
     
-    @pytest.fixture
-    def setup_game(self):
-        """Setup a fresh game"""
-        test_words = ['cat', 'cats', 'at', 'a', 'dog', 'dogs', 'qi', 'qat']
-        dictionary_path = Path(__file__).parent.parent / 'resources' / 'test_dictionary.txt'
-        dictionary_path.parent.mkdir(exist_ok=True)
-        with open(dictionary_path, 'w') as f:
-            f.write('\n'.join(test_words))
-        
-        rule = Rule(str(dictionary_path))
-        game = Game(rule)
-        return game
-    
     def test_word_multiplier_accumulation(self, setup_game):
         """
         Test: Word multipliers should multiply together, not add
@@ -277,25 +261,18 @@ class TestScoreEdgeCases:
         expected = 0 + 50  # All blanks + bingo
         assert score == expected, f"All blanks bingo: expected {expected}, got {score}"
     
-    def test_getattr_fallback_for_missing_multipliers(self, setup_game):
+    def test_getattr_fallback_for_missing_multipliers(self, setup_game, monkeypatch):
         """
         Test: If rule doesn't have multiplier grids, fallback to all 1s
         """
         game = setup_game
-        # Temporarily remove multipliers
-        old_wm = game.rule.word_multiplier
-        old_lm = game.rule.letter_multiplier
-        
-        delattr(game.rule, 'word_multiplier')
-        delattr(game.rule, 'letter_multiplier')
+        # Temporarily remove multipliers; monkeypatch restores them on the shared rule
+        monkeypatch.delattr(game.rule, 'word_multiplier')
+        monkeypatch.delattr(game.rule, 'letter_multiplier')
         
         additions = [('C', [7, 7]), ('A', [7, 8]), ('T', [7, 9])]
         score = game._score_calculator(additions)
         
-        # Restore multipliers
-        game.rule.word_multiplier = old_wm
-        game.rule.letter_multiplier = old_lm
-        
         # Without multipliers, CAT = 3 + 1 + 1 = 5
         expected = 5
         assert score == expected, f"Fallback multipliers: expected {expected}, got {score}"
@@ -0,0 +1,42 @@
+import pytest
+from utils.linear.simple_pattern_generator import SimplePatternGenerator
+
+
+WORDS = ['cat', 'cot', 'cut', 'dog', 'act', 'at']
+
+
+def test_generate_without_word_list_uses_bound_list():
+    """Test that generate() with no word list answers from the list given to bind_word_list."""
+    generator = SimplePatternGenerator()
+    generator.bind_word_list(WORDS)
+
+    assert sorted(generator.generate('C_T', 'CTAO')) == ['CAT', 'COT']
+    assert sorted(generator.generate('C_T', 'CTAO')) == sorted(generator.generate('C_T', 'CTAO', WORDS))
+    assert sorted(generator.generate('__', 'AT')) == ['AT']
+
+
+def test_explicit_word_list_overrides_bound_list():
+    """Test that a word list passed to generate() is used instead of the bound one."""
+    generator = SimplePatternGenerator()
+    generator.bind_word_list(WORDS)
+
+    assert generator.generate('C_T', 'CTU', ['cut', 'cat']) == ['CUT']
+    # The bound list is left in place for later calls
+    assert generator.generate('C_T', 'CTU') == ['CUT']
+
+
+def test_rebinding_replaces_word_list():
+    """Test that bind_word_list swaps out a previously bound list."""
+    generator = SimplePatternGenerator()
+    generator.bind_word_list(WORDS)
+    generator.bind_word_list(['cat'])
+
+    assert generator.generate('C_T', 'CTAOU') == ['CAT']
+
+
+def test_generate_without_any_word_list_raises():
+    """Test that generate() with no word list and nothing bound raises ValueError."""
+    generator = SimplePatternGenerator()
+
+    with pytest.raises(ValueError, match="bind_word_list"):
+        generator.generate('C_T', 'CTA')
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from resources.rule_definitions import Rule
 from utils.matrix.game_state import Game
 
 
@@ -130,6 +131,31 @@ def test_two_wildcards_exhaustive():
     assert word.lower() in rule.scrabble_dictionary
 
 
+def test_two_wildcards_with_rule_fill_pattern():
+    """Two wildcards in one word are resolved through Rule.fill_pattern, respecting cross words."""
+    rule = Rule.from_words(['cab', 'cat', 'mat', 'ab', 'at', 'ox'])
+    assert rule.fill_pattern('_a_') == [('C', 'B'), ('C', 'T'), ('M', 'T')]
+    game = Game(rule)
+
+    # An 'X' below (7,9) gives the second wildcard a cross word only 'ox' completes,
+    # and no main word ends in 'O', so no combination is valid
+    game.board[8, 9] = 'X'
+    additions = [('-', [7, 7]), ('A', [7, 8]), ('-', [7, 9])]
+    assert game._wildcard_combinations(additions, [0, 2]) == []
+
+    game.board[8, 9] = ''
+    assert game._wildcard_combinations(additions, [0, 2]) == [('C', 'B'), ('C', 'T'), ('M', 'T')]
+
+
+def test_wildcards_forming_no_word_with_rule():
+    """Several wildcards that form no word of two or more letters accept every combination."""
+    rule = Rule.from_words(['cab', 'ab'])
+    game = Game(rule)
+    additions = [('-', [3, 3]), ('-', [3, 9])]
+    assert game._check_word_valid(additions) is True
+    assert all(ch.islower() for ch, _ in additions)
+
+
 def test_wildcard_with_multipliers():
     """Test that wildcards still trigger word multipliers even though letter value is 0."""
     rule = WildcardRule()
@@ -200,3 +226,49 @@ def test_wildcard_cross_word_constraint():
     # Should resolve wildcard to 'a' since 'AR' is valid ('CAT' and 'AR' both valid)
     assert game._check_word_valid(additions) is True
     assert additions[1][0] == 'a', f"Expected 'a', got {additions[1][0]}"
+
+
+def test_wildcard_resolution_follows_dictionary_changes():
+    """Test that edits to, or swaps of, the dictionary on an unchanged board are seen."""
+    rule = WildcardRule()
+    rule.scrabble_dictionary = set(['cat', 'at'])
+    game = Game(rule)
+
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'a'
+
+    # Same set object, same size, different words
+    rule.scrabble_dictionary.difference_update(['cat', 'at'])
+    rule.scrabble_dictionary.update(['cot', 'ot'])
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'o'
+
+    # Frozenset dictionaries are memoized, and a swapped one is not served stale answers
+    rule.scrabble_dictionary = frozenset(['cut', 'ut'])
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'u'
+    rule.scrabble_dictionary = frozenset(['cit', 'it'])
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'i'
+
+
+def test_rule_fill_letters_follows_dictionary_swap():
+    """Test that a Rule whose dictionary is reassigned drops its memoized fill letters."""
+    rule = Rule.from_words(['cat', 'xa'])
+    game = Game(rule)
+    game.board[6, 8] = 'X'
+
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'a'
+    assert rule.fill_letters('x', '') == {'A'}
+
+    rule.scrabble_dictionary = frozenset(['cot', 'xo'])
+    assert rule.fill_letters('x', '') == {'O'}
+    additions = [('C', [7, 7]), ('-', [7, 8]), ('T', [7, 9])]
+    assert game._check_word_valid(additions) is True
+    assert additions[1][0] == 'o'
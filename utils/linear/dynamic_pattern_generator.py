@@ -1,8 +1,48 @@
-import re
-from collections import Counter
+from functools import lru_cache
+from itertools import product
+
+
+def _parse_range(pattern, i):
+    """
+    Parse the (n,m) range token opening at pattern[i] == '('.
+
+    A plain scan for the comma and closing parenthesis, cheaper than running a regex
+    per token. Returns (n, m, index just past the token), or None if the token is
+    not two runs of digits separated by a comma.
+    """
+    comma = pattern.find(',', i + 1)
+    if comma < 0:
+        return None
+    close = pattern.find(')', comma + 1)
+    if close < 0:
+        return None
+    low, high = pattern[i + 1:comma], pattern[comma + 1:close]
+    if not (low.isdecimal() and high.isdecimal()):
+        return None
+    return int(low), int(high), close + 1
+
+
+@lru_cache(maxsize=512)
+def _expand_pattern(pattern):
+    """
+    Expand a dynamic pattern into all fixed patterns, as a tuple of strings.
+
+    Each (n,m) range becomes a group of n..m underscores and every other character a
+    group of its own; the fixed patterns are the Cartesian product of the groups in
+    order. Cached, since the optimisers expand the same patterns for many anchors.
+    """
+    groups = []
+    idx = 0
+    while idx < len(pattern):
+        token = _parse_range(pattern, idx) if pattern[idx] == '(' else None
+        if token:
+            n, m, idx = token
+            groups.append(tuple('_' * k for k in range(n, m + 1)))
+        else:
+            groups.append((pattern[idx],))
+            idx += 1
+    return tuple(''.join(parts) for parts in product(*groups))
 
-# Precompile regex pattern for better performance
-_RANGE_PATTERN = re.compile(r'\((\d+),(\d+)\)')
 
 class DynamicPatternGenerator:
     """
@@ -11,6 +51,10 @@ class DynamicPatternGenerator:
 
     def __init__(self, simple_pattern_generator):
         self.spg = simple_pattern_generator
+        # generate() results for one frozenset word list, keyed by (pattern, sorted
+        # deck), and the word list they were computed from. See generate
+        self._results = {}
+        self._results_words = None
 
     def __verify_pattern(self, pattern, deck):
         """
@@ -21,7 +65,7 @@ class DynamicPatternGenerator:
         - All letters in pattern must exist in deck with at least as many copies as in pattern, or be covered by blanks ('-')
         Raises ValueError if invalid
         """
-        letter_counts = Counter()
+        pattern_letters = []
         pattern = pattern.upper()
         deck = deck.upper()
         
@@ -29,31 +73,30 @@ class DynamicPatternGenerator:
         i = 0
         while i < len(pattern):
             if pattern[i] == '(': 
-                match = _RANGE_PATTERN.match(pattern, i)
-                if not match:
+                token = _parse_range(pattern, i)
+                if not token:
                     raise ValueError("Invalid range format. Expected (n,m) where n < m")
-                n, m = map(int, match.groups())
+                n, m, end = token
                 if n < 0 or n >= m:
                     raise ValueError(f"Invalid range ({n},{m}). Must have 0 <= n < m")
-                i = match.end()
+                i = end
                 continue
             if pattern[i].isalpha():
-                letter_counts[pattern[i].upper()] += 1
+                pattern_letters.append(pattern[i])
             elif pattern[i] != '_':
                 raise ValueError(f"Invalid character '{pattern[i]}'. Use only letters, '_', and (n,m)")
             i += 1
 
-        # Allow '-' as blank in deck
-        for char in deck:
-            if not (char.isalpha() or char == '-'):
-                raise ValueError("Deck can only contain letters and '-' for blank tiles.")
-        deck_counts = Counter(c for c in deck if c.isalpha())
+        # Allow '-' as blank in deck; one isalpha() over the rest checks every letter
+        letters = deck.replace('-', '')
+        if letters and not letters.isalpha():
+            raise ValueError("Deck can only contain letters and '-' for blank tiles.")
         num_blanks = deck.count('-')
-        missing = 0
-        for letter, count in letter_counts.items():
-            have = deck_counts.get(letter, 0)
-            if have < count:
-                missing += count - have
+        # Letters short of what the pattern needs, counted with C-level str.count
+        # rather than building and walking two Counters
+        pattern_letters = ''.join(pattern_letters)
+        missing = sum(max(pattern_letters.count(letter) - deck.count(letter), 0)
+                      for letter in set(pattern_letters))
         if missing > num_blanks:
             raise ValueError(
                 f"Pattern requires more letters than available in deck (including blanks). "
@@ -67,48 +110,38 @@ class DynamicPatternGenerator:
         E.g. (3,5)J_M(1,2) -> ['___J_M_', '___J_M__', '____J_M_', '____J_M__', '_____J_M_', '_____J_M__']
         Returns: list of strings
         """
-        def expand(parts):
-            if not parts:
-                return ['']
-            first, *rest = parts
-            expanded_rest = expand(rest)
-            result = []
-            if isinstance(first, tuple):
-                n, m = first
-                for k in range(n, m+1):
-                    underscores = '_' * k
-                    for tail in expanded_rest:
-                        result.append(underscores + tail)
-            else:
-                for tail in expanded_rest:
-                    result.append(first + tail)
-            return result
-
-        # Tokenize pattern into list of (n,m) or single chars
-        tokens = []
-        idx = 0
-        paren_pattern = re.compile(r'\((\d+),(\d+)\)')
-        while idx < len(pattern):
-            match = paren_pattern.match(pattern, idx)
-            if match:
-                n, m = int(match.group(1)), int(match.group(2))
-                tokens.append((n, m))
-                idx = match.end()
-            else:
-                tokens.append(pattern[idx])
-                idx += 1
-        return expand(tokens)
+        return list(_expand_pattern(pattern))
     
     def generate(self, pattern, deck, word_list):
         """
         Generate valid words that match the dynamic pattern using available letters in deck.
+
+        The optimisers ask for the same pattern with the same letters from many anchors,
+        so for a frozenset word list (such as Rule.scrabble_dictionary) the result is
+        remembered per pattern and deck letters, in any order, and repeats skip the
+        dictionary search.
         Returns:
             list[str]: List of valid words matching the pattern
         """
+        cacheable = isinstance(word_list, frozenset)
+        if cacheable:
+            if word_list is not self._results_words:
+                self._results = {}
+                self._results_words = word_list
+            key = (pattern.upper(), ''.join(sorted(deck.upper())))
+            words = self._results.get(key)
+            if words is not None:
+                return list(words)
+
         self.__verify_pattern(pattern, deck)
         all_patterns = self.__list_all_patterns(pattern)
         valid_words = set()
         for pat in all_patterns:
             matches = self.spg.generate(pat, deck, word_list)
             valid_words.update(matches)
-        return list(valid_words)
\ No newline at end of file
+        words = list(valid_words)
+        if cacheable:
+            if len(self._results) >= 4096:
+                self._results.clear()
+            self._results[key] = tuple(words)
+        return words
\ No newline at end of file
@@ -1,5 +1,113 @@
 
 from collections import Counter
+from functools import lru_cache
+import numpy as np
+
+
+def _build_length_index(word_list):
+    """
+    Group word_list by length as {length: (words, (length, n) uint8 matrix, {})}.
+
+    The matrix is stored column-major: row j holds the ASCII code of letter j of
+    every word, so a pattern is matched against all words of its length with a few
+    contiguous per-position operations. The dict holds tables derived on demand:
+    per-column sorts for _letter_rows and the letter histograms of _letter_counts.
+    Words keep their word_list order and case; the matrix holds them uppercased, in
+    one bytes-level pass per length rather than a str.upper() per word. Returns None
+    if a word is not ASCII, in which case callers match word by word instead.
+    """
+    by_length = {}
+    for word in word_list:
+        by_length.setdefault(len(word), []).append(word)
+    index = {}
+    for length, words in by_length.items():
+        try:
+            codes = np.frombuffer(''.join(words).encode('ascii').upper(), dtype=np.uint8)
+        except UnicodeEncodeError:
+            return None
+        index[length] = (words, np.ascontiguousarray(codes.reshape(len(words), length).T), {})
+    return index
+
+
+def _letter_rows(entry, pos, letter):
+    """
+    Return the ascending rows of a length index entry whose word has letter at pos.
+
+    The column is sorted once (stably, so rows of one letter stay in order) and kept
+    in the entry; each query is then a binary search for the letter's slice.
+    """
+    _, columns, sorted_columns = entry
+    column = sorted_columns.get(pos)
+    if column is None:
+        order = np.argsort(columns[pos], kind='stable')
+        column = (order, columns[pos].take(order))
+        sorted_columns[pos] = column
+    order, sorted_codes = column
+    code = ord(letter)
+    start, end = np.searchsorted(sorted_codes, [code, code + 1])
+    return order[start:end]
+
+
+def _letter_counts(entry):
+    """
+    Return the (n, 27) uint8 letter histograms of a length index entry's words.
+
+    Column j < 26 counts letter 'A' + j in the word, column 26 any other character.
+    Built once and kept in the entry.
+    """
+    _, columns, derived = entry
+    counts = derived.get('counts')
+    if counts is None:
+        length, n = columns.shape
+        bins = np.full(256, 26, dtype=np.intp)
+        bins[ord('A'):ord('Z') + 1] = np.arange(26)
+        cells = bins.take(columns.T.ravel()) + np.repeat(np.arange(n) * 27, length)
+        counts = np.bincount(cells, minlength=n * 27).astype(np.uint8).reshape(n, 27)
+        derived['counts'] = counts
+    return counts
+
+
+@lru_cache(maxsize=4)
+def _cached_length_index(word_list):
+    """_build_length_index for an immutable (frozenset) word list, built once per list."""
+    return _build_length_index(word_list)
+
+
+def fill_pattern(word_list, pattern):
+    """
+    Return the letters that fill the '_' slots of pattern to make a word of word_list.
+
+    Returns a sorted list of tuples of uppercase letters, one per slot in order.
+    Uses the same length index as SimplePatternGenerator.generate (kept for a
+    frozenset word list), so the fixed letters narrow the rows instead of each of
+    the 26**k letter combinations being tried.
+    """
+    pattern = pattern.upper()
+    slots = [i for i, ch in enumerate(pattern) if ch == '_']
+    cached = isinstance(word_list, frozenset)
+    index = _cached_length_index(word_list) if cached else _build_length_index(word_list)
+    if index is None or not pattern.isascii():
+        return sorted({tuple(word[i] for i in slots)
+                       for word in map(str.upper, word_list)
+                       if len(word) == len(pattern)
+                       and all(ch == '_' or word[i] == ch for i, ch in enumerate(pattern))})
+
+    entry = index.get(len(pattern))
+    if entry is None:
+        return []
+    words, columns, _ = entry
+    rows = None  # all words of the pattern's length
+    for i, ch in enumerate(pattern):
+        if ch == '_':
+            continue
+        if rows is None:
+            rows = _letter_rows(entry, i, ch) if cached else np.flatnonzero(columns[i] == ord(ch))
+        else:
+            rows = rows[columns[i].take(rows) == ord(ch)]
+    if rows is None:
+        rows = np.arange(len(words))
+    return sorted({tuple(words[row][i].upper() for i in slots) for row in rows.tolist()})
+
 
 class SimplePatternGenerator:
     """
@@ -7,7 +115,19 @@ class SimplePatternGenerator:
     """
 
     def __init__(self):
-        pass
+        # Word list bound with bind_word_list and its length index
+        self._word_list = None
+        self._index = None
+
+    def bind_word_list(self, word_list):
+        """
+        Index word_list once for the generate() calls that are given no word list.
+
+        Useful for a plain list of words queried many times; a frozenset (such as
+        Rule.scrabble_dictionary) is indexed once anyway.
+        """
+        self._word_list = word_list
+        self._index = _build_length_index(word_list)
 
     def __verify_pattern(self, pattern, deck):
         """
@@ -25,28 +145,30 @@ class SimplePatternGenerator:
         
         pattern = pattern.upper()
         deck = deck.upper()
-        for char in pattern:
-            if not (char.isalpha() or char == '_'):
-                raise ValueError(
-                    "Pattern can only contain letters and '_' for empty spaces. "
-                    "Do not use spaces - use '_' instead."
-                )
-        for char in deck:
-            if not (char.isalpha() or char == '-'):
-                raise ValueError(
-                    "Deck can only contain letters and '-' for blank tiles. "
-                    "Do not use any separators or spaces to separate letters."
-                )
-        # Count required letters
-        letter_counts = Counter(c for c in pattern if c.isalpha())
-        deck_counts = Counter(c for c in deck if c.isalpha())
-        num_blanks = deck.count('-')
-        # Check if deck (with blanks) can satisfy letter requirements
-        missing = 0
-        for letter, count in letter_counts.items():
-            have = deck_counts.get(letter, 0)
-            if have < count:
-                missing += count - have
+        # Validate each string with one C-level isalpha() over it once its placeholder
+        # is removed, instead of a Python loop per character. An all-placeholder
+        # string leaves nothing to check
+        pattern_letters = pattern.replace('_', '')
+        if pattern_letters and not pattern_letters.isalpha():
+            raise ValueError(
+                "Pattern can only contain letters and '_' for empty spaces. "
+                "Do not use spaces - use '_' instead."
+            )
+        deck_letters = deck.replace('-', '')
+        if deck_letters and not deck_letters.isalpha():
+            raise ValueError(
+                "Deck can only contain letters and '-' for blank tiles. "
+                "Do not use any separators or spaces to separate letters."
+            )
+        # Check if deck (with blanks) can satisfy letter requirements. The strings
+        # above already hold the letters and give the blank count; a pattern with no
+        # more letters than blanks always fits, otherwise count the letters each is
+        # short of with C-level str.count
+        num_blanks = len(deck) - len(deck_letters)
+        if len(pattern_letters) <= num_blanks:
+            return
+        missing = sum(max(pattern_letters.count(letter) - deck_letters.count(letter), 0)
+                      for letter in set(pattern_letters))
         if missing > num_blanks:
             raise ValueError(
                 f"Pattern requires more letters than available in deck (including blanks). "
@@ -78,22 +200,31 @@ class SimplePatternGenerator:
         for idx, letter in zip(fixed_indices, fixed_letters):
             if word[idx] != letter:
                 return False
-        # Count needed letters for wildcards
-        needed = Counter(word[idx] for idx in wildcard_indices)
+        # Letters the wildcards need, counted per distinct letter with C-level
+        # str.count instead of building a Counter for every word
+        needed = ''.join([word[idx] for idx in wildcard_indices])
         # Check if implicit deck has enough letters, using blanks as wildcards
         blanks = implicit_deck_counter.get('-', 0)
-        for letter, count in needed.items():
-            have = implicit_deck_counter.get(letter, 0)
-            if have < count:
-                if have + blanks < count:
+        for letter in set(needed):
+            short = needed.count(letter) - implicit_deck_counter.get(letter, 0)
+            if short > 0:
+                blanks -= short
+                if blanks < 0:
                     return False
-                blanks -= (count - have)
         return True
     
-    def generate(self, pattern, deck, word_list):
+    def generate(self, pattern, deck, word_list=None):
         """
         Generate valid words that match the pattern using available letters in deck.
         Optimized for large word lists.
+
+        The words are matched through a per-length code matrix (see _build_length_index),
+        which is kept for frozenset word lists such as Rule.scrabble_dictionary: fixed
+        letters narrow the rows column by column, starting, for a kept index, from the
+        rows holding the rarest fixed letter. Each row's wildcard letters are then
+        checked against the deck for all remaining rows at once, for a few rows of a
+        kept index by comparing per-word letter histograms (see _letter_counts).
+        Without word_list, the list bound with bind_word_list is used.
         """
         self.__verify_pattern(pattern, deck)
         pattern = pattern.upper()
@@ -105,11 +236,78 @@ class SimplePatternGenerator:
         fixed_indices = [i for i, c in enumerate(pattern) if c.isalpha()]
         fixed_letters = [pattern[i] for i in fixed_indices]
         wildcard_indices = [i for i, c in enumerate(pattern) if c == '_']
-        # Pre-filter by length only
-        candidates = [word.upper() for word in word_list if len(word) == pattern_length]
-        # Use list comprehension for speed
-        matching_words = [
-            word for word in candidates
-            if self.__can_make_word(word, fixed_indices, fixed_letters, wildcard_indices, implicit_deck_counter)
-        ]
-        return matching_words
+
+        if word_list is None:
+            if self._word_list is None:
+                raise ValueError("No word list given and none bound with bind_word_list")
+            word_list, index, cached = self._word_list, self._index, True
+        elif isinstance(word_list, frozenset):
+            index, cached = _cached_length_index(word_list), True
+        else:
+            index, cached = _build_length_index(word_list), False
+        if index is None or not pattern.isascii():
+            # Pre-filter by length only
+            candidates = [word.upper() for word in word_list if len(word) == pattern_length]
+            # Use list comprehension for speed
+            matching_words = [
+                word for word in candidates
+                if self.__can_make_word(word, fixed_indices, fixed_letters, wildcard_indices, implicit_deck_counter)
+            ]
+            return matching_words
+
+        if pattern_length not in index:
+            return []
+        entry = index[pattern_length]
+        words, columns, _ = entry
+        fixed = list(zip(fixed_indices, fixed_letters))
+        rows = None  # all words of the pattern's length
+        if cached and fixed:
+            # Start from the smallest of the fixed letters' row sets (sorting a column
+            # pays off across the many queries a kept index serves)
+            buckets = [_letter_rows(entry, idx, letter) for idx, letter in fixed]
+            first = min(range(len(fixed)), key=lambda i: len(buckets[i]))
+            rows = buckets[first]
+            del fixed[first]
+        # Fixed letters: keep the rows matching each fixed column in turn
+        for idx, letter in fixed:
+            if rows is None:
+                rows = np.flatnonzero(columns[idx] == ord(letter))
+            else:
+                rows = rows[columns[idx].take(rows) == ord(letter)]
+
+        blanks = implicit_deck_counter.get('-', 0)
+        if cached and rows is not None and len(rows) <= 2048:
+            # Few rows left in a kept index: compare whole-word letter histograms
+            # against the fixed letters plus the deck in one pass, instead of a pass
+            # per slot and deck letter
+            allowed = np.zeros(27, dtype=np.int16)
+            for letter in pattern.replace('_', '') + implicit_deck:
+                if 'A' <= letter <= 'Z':
+                    allowed[ord(letter) - ord('A')] += 1
+            short = np.maximum(_letter_counts(entry).take(rows, axis=0) - allowed, 0)
+            rows = rows[short.sum(axis=1) <= blanks]
+            return [words[i].upper() for i in rows.tolist()]
+
+        # Wildcards: a slot holding a letter missing from the deck needs a blank;
+        # count those per row with one table lookup per slot
+        deck_letters = [letter for letter in implicit_deck_counter if letter != '-' and ord(letter) < 256]
+        not_in_deck = np.ones(256, dtype=np.uint8)
+        not_in_deck[[ord(letter) for letter in deck_letters]] = 0
+        slot_codes = [columns[idx] if rows is None else columns[idx].take(rows)
+                      for idx in wildcard_indices]
+        excess = np.zeros(len(words) if rows is None else len(rows), dtype=np.uint8)
+        for codes in slot_codes:
+            excess += not_in_deck.take(codes)
+        keep = np.flatnonzero(excess <= blanks)
+        rows = keep if rows is None else rows[keep]
+        excess = excess[keep]
+        slot_codes = [codes[keep] for codes in slot_codes]
+        # A deck letter covers at most as many slots as there are copies of it; the
+        # slots beyond that need blanks too
+        for letter in deck_letters:
+            have = implicit_deck_counter[letter]
+            if have < len(wildcard_indices):
+                count = sum((codes == ord(letter)).astype(np.int16) for codes in slot_codes)
+                excess = excess + np.maximum(count - have, 0)
+        rows = rows[excess <= blanks]
+        return [words[i].upper() for i in rows.tolist()]
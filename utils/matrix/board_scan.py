@@ -0,0 +1,285 @@
+"""
+Compiled scanning kernels for the 15x15 board.
+
+The kernels work on the integer view of the board (see Game.board_codes()), where
+0 marks an empty cell. Numba is an optional dependency: when it is installed the
+kernels are JIT-compiled (and cached on disk), otherwise the very same functions
+run as plain Python. Compiled kernels release the GIL, so games scored from
+several threads run concurrently.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba not installed: run the kernels as plain Python
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+# Flag or-ed into the code of a tile placed this turn, on the scoring boards.
+# Code points stay below 2**21, so the bit never clashes with a letter and the
+# kernels can test newness on the code they already loaded
+NEW_TILE = 1 << 24
+
+
+@njit(cache=True, nogil=True)
+def collect_runs(codes, min_len):
+    """
+    Find every horizontal and vertical run of occupied cells of at least min_len cells.
+
+    Args:
+        codes: 2D integer board view, 0 for empty cells
+        min_len: minimum run length to report
+
+    Returns:
+        (n, 4) int64 array of (axis, line, start, end) rows, where axis is 0 for a
+        horizontal run in row `line` and 1 for a vertical run in column `line`, and
+        end is exclusive. Horizontal runs come first, each group in board order.
+    """
+    n_rows, n_cols = codes.shape
+    # A line of n cells holds at most (n + 1) // 2 runs
+    out = np.empty((n_rows * ((n_cols + 1) // 2) + n_cols * ((n_rows + 1) // 2), 4), dtype=np.int64)
+    n = 0
+
+    # Horizontal scan
+    for r in range(n_rows):
+        c = 0
+        while c < n_cols:
+            if codes[r, c] == 0:
+                c += 1
+                continue
+            start = c
+            while c < n_cols and codes[r, c] != 0:
+                c += 1
+            if c - start >= min_len:
+                out[n, 0] = 0
+                out[n, 1] = r
+                out[n, 2] = start
+                out[n, 3] = c
+                n += 1
+
+    # Vertical scan
+    for c in range(n_cols):
+        r = 0
+        while r < n_rows:
+            if codes[r, c] == 0:
+                r += 1
+                continue
+            start = r
+            while r < n_rows and codes[r, c] != 0:
+                r += 1
+            if r - start >= min_len:
+                out[n, 0] = 1
+                out[n, 1] = c
+                out[n, 2] = start
+                out[n, 3] = r
+                n += 1
+
+    return out[:n]
+
+
+@njit(cache=True, nogil=True)
+def _run_around(occupied, axis, line, pos):
+    """Return the (start, end) of the occupied run through cell pos of a row (axis 0) or column (axis 1)."""
+    n = occupied.shape[1] if axis == 0 else occupied.shape[0]
+    start = pos
+    end = pos + 1
+    if axis == 0:
+        while start > 0 and occupied[line, start - 1]:
+            start -= 1
+        while end < n and occupied[line, end]:
+            end += 1
+    else:
+        while start > 0 and occupied[start - 1, line]:
+            start -= 1
+        while end < n and occupied[end, line]:
+            end += 1
+    return start, end
+
+
+@njit(cache=True, nogil=True)
+def move_word_spans(occupied, rows, cols):
+    """
+    Find the main word and the cross words formed by a move.
+
+    Args:
+        occupied: 2D bool mask of occupied cells with the move applied
+        rows, cols: positions of the newly placed tiles
+
+    Returns:
+        (n, 4) int64 array of (axis, line, start, end) rows in the collect_runs
+        layout. The main word comes first, then one cross word per new tile in
+        move order; single-letter runs are left out. A move whose tiles all share
+        a row is treated as horizontal, otherwise as vertical along the first
+        column.
+    """
+    n = rows.shape[0]
+    out = np.empty((n + 1, 4), dtype=np.int64)
+    k = 0
+
+    horizontal = True
+    for i in range(1, n):
+        if rows[i] != rows[0]:
+            horizontal = False
+            break
+    if horizontal:
+        axis, line, along = 0, rows[0], cols
+    else:
+        axis, line, along = 1, cols.min(), rows
+    lo = along.min()
+    hi = along.max()
+    line_len = occupied.shape[1] if axis == 0 else occupied.shape[0]
+
+    # Main word: the first occupied run of the line overlapping the new tiles
+    p = 0
+    while p < line_len:
+        cell = occupied[line, p] if axis == 0 else occupied[p, line]
+        if not cell:
+            p += 1
+            continue
+        start, end = _run_around(occupied, axis, line, p)
+        if lo < end and hi >= start:
+            if end - start > 1:
+                out[k, 0] = axis
+                out[k, 1] = line
+                out[k, 2] = start
+                out[k, 3] = end
+                k += 1
+            break
+        p = end
+
+    # Cross words: the perpendicular run through each new tile
+    cross_axis = 1 - axis
+    for i in range(n):
+        cross_line = along[i]
+        if not (occupied[line, cross_line] if axis == 0 else occupied[cross_line, line]):
+            continue
+        start, end = _run_around(occupied, cross_axis, cross_line, line)
+        if end - start > 1:
+            out[k, 0] = cross_axis
+            out[k, 1] = cross_line
+            out[k, 2] = start
+            out[k, 3] = end
+            k += 1
+
+    return out[:k]
+
+
+@njit(cache=True, nogil=True)
+def score_words(codes, spans, points, letter_mult, word_mult):
+    """
+    Sum the scores of the words formed by a move.
+
+    Args:
+        codes: 2D integer board view with the move applied, the tiles placed this
+            turn or-ed with NEW_TILE. A lowercase new tile is a blank worth 0 points;
+            other letters score as their uppercase letter
+        spans: (n, 4) word spans as returned by move_word_spans
+        points: letter points indexed by uppercase code point; codes past its end score 0
+        letter_mult, word_mult: 2D multiplier grids, only applied under new tiles
+
+    Returns:
+        The total of letter points times word multipliers over all words, without
+        any bingo bonus.
+    """
+    total = 0
+    for w in range(spans.shape[0]):
+        letter_sum = 0
+        mult = 1
+        for p in range(spans[w, 2], spans[w, 3]):
+            if spans[w, 0] == 0:
+                r = spans[w, 1]
+                c = p
+            else:
+                r = p
+                c = spans[w, 1]
+            code = int(codes[r, c])
+            new = (code >> 24) & 1
+            code &= NEW_TILE - 1
+            # ASCII lowercase is uppercase | 0x20, so bit 5 of a letter's code marks a
+            # blank and clearing it gives the letter to look up
+            lower = (code >> 5) & 1 if code >= 0x40 else 0
+            letter = code - (lower << 5)
+            # Multipliers only count under new tiles; select them arithmetically
+            # rather than branching on newness in the inner loop
+            base = 0
+            if letter < points.shape[0]:
+                base = int(points[letter]) * (1 - new * lower)
+            letter_sum += base * (1 + new * (int(letter_mult[r, c]) - 1))
+            mult *= 1 + new * (max(int(word_mult[r, c]), 1) - 1)
+        total += letter_sum * mult
+    return total
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def score_moves(codes, moves, points, letter_mult, word_mult):
+    """
+    Score a batch of candidate moves against the same board, in parallel over moves.
+
+    Args:
+        codes: 2D integer board view
+        moves: (k, max_tiles, 3) integer array of (code, row, col) per new tile; a
+            move shorter than max_tiles is padded with rows of -1
+        points, letter_mult, word_mult: as for score_words
+
+    Returns:
+        Length-k int64 array of move scores, including the bingo bonus for moves
+        placing 7 tiles. A lowercase tile code is a blank worth 0 points.
+    """
+    out = np.empty(moves.shape[0], dtype=np.int64)
+    for i in prange(moves.shape[0]):
+        n = 0
+        while n < moves.shape[1] and moves[i, n, 0] >= 0:
+            n += 1
+        temp = codes.copy()
+        for j in range(n):
+            temp[moves[i, j, 1], moves[i, j, 2]] = moves[i, j, 0] | NEW_TILE
+        spans = move_word_spans(temp != 0, moves[i, :n, 1], moves[i, :n, 2])
+        out[i] = score_words(temp, spans, points, letter_mult, word_mult) + 50 * (n == 7)
+    return out
+
+
+def span_cells(spans):
+    """Return the (rows, cols) index arrays of every cell of every span, span after span."""
+    lengths = spans[:, 3] - spans[:, 2]
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    along = np.repeat(spans[:, 2], lengths) + offsets
+    line = np.repeat(spans[:, 1], lengths)
+    horizontal = np.repeat(spans[:, 0] == 0, lengths)
+    return np.where(horizontal, line, along), np.where(horizontal, along, line)
+
+
+def _score_words_numpy(codes, spans, points, letter_mult, word_mult):
+    """
+    NumPy version of score_words, used when Numba is not installed.
+
+    Gathers every word cell's points and multipliers with fancy indexing and
+    reduces each word's segment with reduceat, instead of interpreting the
+    per-cell loop.
+    """
+    if spans.shape[0] == 0:
+        return 0
+    rows, cols = span_cells(spans)
+    cell_codes = codes[rows, cols].astype(np.intp)
+    new = (cell_codes & NEW_TILE).astype(bool)
+    cell_codes &= NEW_TILE - 1
+    lower = np.bitwise_and(cell_codes, 0x20).astype(bool) & (cell_codes >= 0x40)
+    letters = np.where(lower, cell_codes - 0x20, cell_codes)
+    in_table = letters < points.shape[0]
+    base = np.where(in_table, points[np.where(in_table, letters, 0)], 0).astype(np.int64)
+    base[lower & new] = 0
+    lm = np.where(new, letter_mult[rows, cols], 1).astype(np.int64)
+    wm = np.where(new, np.maximum(word_mult[rows, cols], 1), 1).astype(np.int64)
+    lengths = spans[:, 3] - spans[:, 2]
+    starts = np.cumsum(lengths) - lengths
+    return int((np.add.reduceat(base * lm, starts) * np.multiply.reduceat(wm, starts)).sum())
+
+
+if not HAVE_NUMBA:
+    score_words = _score_words_numpy
@@ -5,6 +5,25 @@ import random
 import string
 from itertools import product
 
+from resources.rule_definitions import build_letter_points_table
+from utils.matrix.board_scan import NEW_TILE, move_word_spans, score_moves, score_words
+
+# Identity multiplier grid for rules without special squares; shared and read-only
+# so the scorer's getattr fallback does not allocate a new grid per call
+_ONES_15 = np.ones((15, 15), dtype=np.int8)
+_ONES_15.flags.writeable = False
+
+def cells_text(cells: np.ndarray) -> str:
+    """
+    Join a 1D array of 'U1' board cells into a string.
+
+    Word-length slices are joined through tolist(), which for a handful of cells is
+    about three times cheaper than decoding their UCS-4 buffer (a contiguous copy,
+    tobytes and a codec call). Empty cells are dropped.
+    """
+    return ''.join(cells.tolist())
+
+
 class Game:
     def __init__(self, rule):
         """
@@ -17,10 +36,109 @@ class Game:
         # Initialize empty 15x15 board using NumPy
         self.board = np.full((15, 15), '', dtype='U1')  # U1 for single Unicode character
         self.start_pos = (7, 7)  # Standard Scrabble starting position at center (7,7)
+        # Per-line run decomposition cache: (axis, index) -> (line bytes, blocks)
+        self._line_blocks = {}
+        # Memo of per-board results (scores, wildcard resolutions): the board bytes it
+        # is valid for, and the entries themselves. See _board_memo
+        self._memo_board = None
+        self._memo = {}
+        # Multiplier labels for printing: (word grid, letter grid, labels). See _special_grid
+        self._special = None
+        # The rule's own scoring tables, once they needed no conversion. See _score_tables
+        self._tables = None
+
+    def __copy__(self):
+        """
+        Return a new Game sharing this game's rule, with its own copy of the board.
+
+        The rule (dictionary, points, multipliers) is shared, not duplicated; only
+        the 15x15 board is copied, and the copy starts with empty caches.
+        """
+        clone = Game(self.rule)
+        clone.board = self.board.copy()
+        clone.start_pos = self.start_pos
+        return clone
 
     def empty_board(self):
         self.board = np.full((15, 15), '', dtype='U1') 
 
+    def board_codes(self) -> np.ndarray:
+        """
+        Return a zero-copy integer view of the board.
+
+        Each 'U1' cell is stored as a single UCS-4 code unit, so viewing the buffer as
+        uint32 gives the letter's code point (0 for an empty cell). Occupancy tests on
+        this view are plain integer compares instead of string compares, and since it
+        is a view it always reflects the current board contents.
+        """
+        return self.board.view(np.uint32)
+
+    def occupied(self) -> np.ndarray:
+        """
+        Return a boolean 15x15 mask of occupied cells.
+
+        Derived from board_codes() on each call rather than maintained alongside the
+        board, so it is always in sync however the board was written to.
+        """
+        return self.board_codes() != 0
+
+    def place_word(self, row: int, col: int, axis: str, text: str) -> None:
+        """
+        Write text onto the board starting at (row, col), without any validation.
+
+        Args:
+            row, col: position of the first letter
+            axis: 'H' to write along the row, 'V' to write down the column
+            text: letters to write, one per cell
+
+        The letters are written with a single slice assignment.
+        Intended for setting up boards; moves should go through new_move.
+        """
+        if axis == 'H':
+            self.board[row, col:col + len(text)] = list(text)
+        else:
+            self.board[row:row + len(text), col] = list(text)
+
+    def line_blocks(self, axis: str, index: int) -> Tuple[List[int], List[int], List[str]]:
+        """
+        Return the occupied runs ("blocks") of one board line.
+
+        Args:
+            axis: 'H' for row `index`, 'V' for column `index`
+            index: row or column number
+
+        Returns:
+            (starts, ends, texts): block start indices, exclusive end indices and the
+            uppercase letters of each block, ordered along the line.
+
+        The decomposition is cached per line and keyed on the line's contents, so it
+        stays correct however the board is modified (new_move, _update or direct writes).
+        """
+        line = self.board[index] if axis == 'H' else self.board[:, index]
+        line_bytes = line.tobytes()
+        cached = self._line_blocks.get((axis, index))
+        if cached is not None and cached[0] == line_bytes:
+            return cached[1]
+
+        # Walk the line's cells once, extending each run from its first letter; for 15
+        # cells this beats building padded edge arrays with np.diff/np.flatnonzero
+        cells = line.tolist()
+        starts, ends, texts = [], [], []
+        i, n = 0, len(cells)
+        while i < n:
+            if not cells[i]:
+                i += 1
+                continue
+            start = i
+            while i < n and cells[i]:
+                i += 1
+            starts.append(start)
+            ends.append(i)
+            texts.append(''.join(cells[start:i]).upper())
+        blocks = (starts, ends, texts)
+        self._line_blocks[(axis, index)] = (line_bytes, blocks)
+        return blocks
+
     def _verify_word_addition(self, additions: List[Tuple[str, List[int]]]) -> bool:
         """
         Verify that all additions are in a single row or column, continuous, within bounds,
@@ -39,39 +157,36 @@ class Game:
             raise ValueError("No letters provided for addition")
             return False
 
+        # A move has at most a handful of tiles, and at that size every NumPy call
+        # (array build, compare, reduction) costs more than a plain pass over the
+        # positions, so the checks run on Python ints
+        positions = [(pos[0], pos[1]) for _, pos in additions]
+        n_rows, n_cols = self.board.shape
+
         # Check boundaries
-        for _, [row, col] in additions:
-            if not (0 <= row < 15 and 0 <= col < 15):
+        for row, col in positions:
+            if not (0 <= row < n_rows and 0 <= col < n_cols):
                 raise ValueError(f"Position ({row},{col}) is out of bounds")
-                return False
         
         # Check for overlap with existing letters
-        for _, [row, col] in additions:
-            if self.board[row, col] != '':
+        board = self.board
+        for row, col in positions:
+            if board[row, col]:
                 raise ValueError(f"Position ({row},{col}) is already occupied")
-                return False
             
-        # Check if additions form a continuous line
-        pos_array = np.array([pos for _, pos in additions])
-        unique_rows = np.unique(pos_array[:, 0])
-        unique_cols = np.unique(pos_array[:, 1])
-        
-        # Check if additions are in a single row or column
-        if len(unique_rows) > 1 and len(unique_cols) > 1:
+        # Check if additions are in a single row or column; the other coordinate
+        # is the one that has to be continuous
+        first_row, first_col = positions[0]
+        if all(row == first_row for row, _ in positions):
+            line = sorted(col for _, col in positions)
+        elif all(col == first_col for _, col in positions):
+            line = sorted(row for row, _ in positions)
+        else:
             raise ValueError("Letters must be placed in a single row or column")
-            return False
             
-        # Check continuity
-        if len(unique_rows) == 1:
-            cols = np.sort(pos_array[:, 1])
-            if np.ptp(cols) + 1 != len(additions):
-                raise ValueError("Letters must form a continuous line without gaps")
-                return False
-        else:  # len(unique_cols) == 1
-            rows = np.sort(pos_array[:, 0])
-            if np.ptp(rows) + 1 != len(additions):
-                raise ValueError("Letters must form a continuous line without gaps")
-                return False
+        # Check continuity: the sorted positions must step by exactly one cell
+        if any(b - a != 1 for a, b in zip(line, line[1:])):
+            raise ValueError("Letters must form a continuous line without gaps")
                 
         return True
 
@@ -85,8 +200,12 @@ class Game:
         Raises ValueError with a descriptive message on failure.
         Returns True on success.
         """
-        board_letter_count = np.sum(self.board != '')
-        if board_letter_count == 0:
+        # A move touching a tile is valid and implies a non-empty board, so the
+        # emptiness scan only runs for moves that touch nothing
+        if self._touches_existing_word(additions):
+            return True
+
+        if not self.board_codes().any():
             start_covered = any(pos[0] == self.start_pos[0] and pos[1] == self.start_pos[1]
                                 for _, pos in additions)
             if not start_covered:
@@ -94,26 +213,61 @@ class Game:
             return True
 
         # Not the first move: must connect to existing words
-        if not self._touches_existing_word(additions):
-            raise ValueError("New letters must connect to existing words")
-        return True
+        raise ValueError("New letters must connect to existing words")
 
     def _touches_existing_word(self, additions: List[Tuple[str, List[int]]]) -> bool:
         """
         Return True if any of the additions touches an existing tile (orthogonally).
+
+        Probes the four neighbours of each new tile on the occupancy mask and stops
+        at the first occupied one; a move has at most a handful of tiles, so this
+        beats building and masking whole-board neighbour arrays. A tile off the board
+        touches nothing (and is never probed, since a negative index would wrap).
         """
-        if not additions:
-            return False
-        pos_array = np.array([pos for _, pos in additions])
-        # adjacent offsets
-        adj = np.array([[-1, 0], [1, 0], [0, -1], [0, 1]])
-        all_adj = (pos_array[:, None, :] + adj[None, :, :]).reshape(-1, 2)
-        # filter valid
-        valid = (all_adj[:, 0] >= 0) & (all_adj[:, 0] < 15) & (all_adj[:, 1] >= 0) & (all_adj[:, 1] < 15)
-        valid_adj = all_adj[valid]
-        if valid_adj.size == 0:
-            return False
-        return np.any(self.board[valid_adj[:, 0], valid_adj[:, 1]] != '')
+        occupied = self.occupied()
+        n_rows, n_cols = occupied.shape
+        for _, (row, col) in additions:
+            if not (0 <= row < n_rows and 0 <= col < n_cols):
+                continue
+            if ((row > 0 and occupied[row - 1, col]) or (row + 1 < n_rows and occupied[row + 1, col])
+                    or (col > 0 and occupied[row, col - 1]) or (col + 1 < n_cols and occupied[row, col + 1])):
+                return True
+        return False
+
+    def _special_grid(self) -> np.ndarray:
+        """
+        Return a 15x15 object array of each cell's multiplier label ('TW', 'DL',
+        'TW+DL', ... or '').
+
+        Built with one mask per label and cached until the rule's multiplier grids
+        are swapped out (a missing grid contributes no labels).
+        """
+        wm = getattr(self.rule, 'word_multiplier', None)
+        lm = getattr(self.rule, 'letter_multiplier', None)
+        if self._special is not None and self._special[0] is wm and self._special[1] is lm:
+            return self._special[2]
+
+        grid = np.full(self.board.shape, '', dtype=object)
+        masks = []
+        if wm is not None:
+            masks += [(wm == 3, 'TW'), (wm == 2, 'DW')]
+        if lm is not None:
+            masks += [(lm == 3, 'TL'), (lm == 2, 'DL')]
+        for mask, tag in masks:
+            grid[mask] = np.where(grid[mask] == '', tag, grid[mask] + '+' + tag)
+        self._special = (wm, lm, grid)
+        return grid
+
+    def _board_cells(self) -> List[List[str]]:
+        """
+        Return the display text of every cell, row by row: 'L(points)' for a letter or
+        '.' for an empty cell, followed by the cell's multiplier label if any.
+        """
+        special = self._special_grid()
+        letter_points = self.rule.letter_points
+        return [[(f"{letter}({letter_points.get(letter.upper(), 0)})" if letter else '.') + label
+                 for letter, label in zip(letters, labels)]
+                for letters, labels in zip(self.board.tolist(), special.tolist())]
 
     def print_board(self) -> None:
         """
@@ -126,46 +280,13 @@ class Game:
 
         The output is a single matrix where each cell is a fixed-width field.
         """
-        # Helper to get special token for a cell
-        def _cell_special(r: int, c: int) -> str:
-            wm = getattr(self.rule, 'word_multiplier', None)
-            lm = getattr(self.rule, 'letter_multiplier', None)
-            special_parts = []
-            if wm is not None:
-                val = int(wm[r, c])
-                if val == 3:
-                    special_parts.append('TW')
-                elif val == 2:
-                    special_parts.append('DW')
-            if lm is not None:
-                val = int(lm[r, c])
-                if val == 3:
-                    special_parts.append('TL')
-                elif val == 2:
-                    special_parts.append('DL')
-            return '+'.join(special_parts) if special_parts else ''
-
         # Column header (shifted left for better alignment)
         header = '  ' + ' '.join(f'{c:7d}' for c in range(self.board.shape[1]))
-        print(header)
-        print('  ' + '-------' * self.board.shape[1])
-
-        for r in range(self.board.shape[0]):
-            row_cells = []
-            for c in range(self.board.shape[1]):
-                letter = self.board[r, c]
-                special = _cell_special(r, c)
-                if letter != '':
-                    score = self.rule.letter_points.get(letter.upper(), 0)
-                    content = f"{letter}({score})"
-                    if special:
-                        content = f"{content}{special}"
-                else:
-                    content = '.'
-                    if special:
-                        content = f".{special}"
-                row_cells.append(f'{content:7s}')
-            print(f'{r:2d} |' + ' '.join(row_cells))
+        lines = [header, '  ' + '-------' * self.board.shape[1]]
+        lines += [f'{r:2d} |' + ' '.join(f'{content:7s}' for content in row_cells)
+                  for r, row_cells in enumerate(self._board_cells())]
+        # One write for the whole board rather than a print per row
+        print('\n'.join(lines))
 
     def pretty_print_board(self) -> None:
         """
@@ -175,51 +296,21 @@ class Game:
         - if occupied: the letter's point value (from self.rule.letter_points)
         - any special cell multiplier (TW, DW, TL, DL)
         """
-
-        def _cell_special(r: int, c: int) -> str:
-            wm = getattr(self.rule, 'word_multiplier', None)
-            lm = getattr(self.rule, 'letter_multiplier', None)
-            special_parts = []
-            if wm is not None:
-                val = int(wm[r, c])
-                if val == 3:
-                    special_parts.append('TW')
-                elif val == 2:
-                    special_parts.append('DW')
-            if lm is not None:
-                val = int(lm[r, c])
-                if val == 3:
-                    special_parts.append('TL')
-                elif val == 2:
-                    special_parts.append('DL')
-            return '+'.join(special_parts) if special_parts else ''
-
-        table = []
-        for r in range(self.board.shape[0]):
-            row_cells = []
-            for c in range(self.board.shape[1]):
-                letter = self.board[r, c]
-                special = _cell_special(r, c)
-                if letter != '':
-                    score = self.rule.letter_points.get(letter.upper(), 0)
-                    content = f"{letter}({score})"
-                    if special:
-                        content = f"{content}{special}"
-                else:
-                    content = '.'
-                    if special:
-                        content = f".{special}"
-                row_cells.append(content)
-            table.append(row_cells)
-
         headers = [str(c) for c in range(self.board.shape[1])]
-        print(tabulate(table, headers=headers, showindex="always", tablefmt="fancy_grid"))
+        print(tabulate(self._board_cells(), headers=headers, showindex="always", tablefmt="fancy_grid"))
     
+    @staticmethod
+    def _word_spans(temp_board: np.ndarray, additions: List[Tuple[str, List[int]]]) -> np.ndarray:
+        """Return the (axis, line, start, end) spans of the words formed by additions on temp_board."""
+        positions = np.array([pos for _, pos in additions])
+        return move_word_spans(temp_board.view(np.uint32) != 0, positions[:, 0], positions[:, 1])
+
     def _extract_word_positions(self, temp_board: np.ndarray, additions: List[Tuple[str, List[int]]]) -> List[List[Tuple[int, int]]]:
         """
         Extract all word positions (main and cross words) formed by additions on temp_board.
         
-        This is the efficient NumPy-based implementation used by both word extraction and scoring.
+        The spans come from the compiled move_word_spans kernel (which the scorer also
+        uses directly); this turns them into per-cell position lists.
         
         Args:
             temp_board: Board with additions already applied
@@ -231,79 +322,13 @@ class Game:
         if not additions:
             return []
             
-        positions = np.array([pos for _, pos in additions])
+        spans = self._word_spans(temp_board, additions)
         words: List[List[Tuple[int, int]]] = []
-        
-        # Get the primary word (horizontal or vertical)
-        unique_rows = np.unique(positions[:, 0])
-        unique_cols = np.unique(positions[:, 1])
-        
-        if len(unique_rows) == 1:  # Horizontal word
-            row = unique_rows[0]
-            # Find segment boundaries
-            occupied = temp_board[row] != ''
-            # Get leftmost and rightmost occupied positions of the word added
-            min_col, max_col = positions[:, 1].min(), positions[:, 1].max()
-            # Get all continuous occupied positions
-            segments = np.split(np.arange(15), np.where(np.diff(occupied))[0] + 1)
-            occupied_segments = [seg for seg in segments if occupied[seg[0]]]
-            # Find the segment containing our new word
-            for seg in occupied_segments:
-                if min_col <= seg[-1] and max_col >= seg[0]:  # Segment overlaps with additions
-                    main_word_positions = [(row, c) for c in range(seg[0], seg[-1] + 1)]
-                    if len(main_word_positions) > 1:
-                        words.append(main_word_positions)
-                    break # since we should only get one continuous word as result of our addition
-                        
-            # Get cross words efficiently
-            cross_occupied = temp_board[:, positions[:, 1]] != ''  # Matrix of occupied positions for all addition columns
-            # For each column, find the continuous segment containing the current row
-            for i, seg_col in enumerate(cross_occupied.T):  # Still need to process each column's segments
-                if not seg_col[row]:  # Skip if position isn't occupied
-                    continue
-                # Find segment boundaries
-                indices = np.where(seg_col)[0]  # Get all occupied positions
-                # Find the segment containing our row
-                segment_idx = (indices[:-1] + 1 == indices[1:])  # True where indices are consecutive
-                segment_boundaries = np.split(indices, np.where(~segment_idx)[0] + 1)
-                segment = next((seg for seg in segment_boundaries if row in seg), None)
-                if segment is not None and len(segment) > 1:
-                    cross_word_positions = [(r, positions[i, 1]) for r in range(segment[0], segment[-1] + 1)]
-                    words.append(cross_word_positions)
-                            
-        else:  # Vertical word
-            col = unique_cols[0]
-            # Find segment boundaries
-            occupied = temp_board[:, col] != ''
-            # Get topmost and bottommost occupied positions of the newly added word
-            min_row, max_row = positions[:, 0].min(), positions[:, 0].max()
-            # Get all continuous occupied positions
-            segments = np.split(np.arange(15), np.where(np.diff(occupied))[0] + 1)
-            occupied_segments = [seg for seg in segments if occupied[seg[0]]]
-            # Find the segment containing our new word
-            for seg in occupied_segments:
-                if min_row <= seg[-1] and max_row >= seg[0]:  # Segment overlaps with additions
-                    main_word_positions = [(r, col) for r in range(seg[0], seg[-1] + 1)]
-                    if len(main_word_positions) > 1:
-                        words.append(main_word_positions)
-                    break # since we should only get one continuous word as result of our addition
-                        
-            # Get cross words efficiently
-            cross_occupied = temp_board[positions[:, 0], :] != ''  # Matrix of occupied positions for all addition rows
-            # For each row, find the continuous segment containing the current column
-            for i, seg_row in enumerate(cross_occupied):  # Still need to process each row's segments
-                if not seg_row[col]:  # Skip if position isn't occupied
-                    continue
-                # Find segment boundaries
-                indices = np.where(seg_row)[0]  # Get all occupied positions
-                # Find the segment containing our column
-                segment_idx = (indices[:-1] + 1 == indices[1:])  # True where indices are consecutive
-                segment_boundaries = np.split(indices, np.where(~segment_idx)[0] + 1)
-                segment = next((seg for seg in segment_boundaries if col in seg), None)
-                if segment is not None and len(segment) > 1:
-                    cross_word_positions = [(positions[i, 0], c) for c in range(segment[0], segment[-1] + 1)]
-                    words.append(cross_word_positions)
-                            
+        for axis, line, start, end in spans.tolist():
+            if axis == 0:
+                words.append([(line, c) for c in range(start, end)])
+            else:
+                words.append([(r, line) for r in range(start, end)])
         return words
     
     def _get_all_affected_words(self, additions: List[Tuple[str, List[int]]]) -> Set[str]:
@@ -319,16 +344,11 @@ class Game:
         for letter, [row, col] in additions:
             temp_board[row, col] = letter
         
-        # Use the efficient helper to get word positions
-        word_positions = self._extract_word_positions(temp_board, additions)
-        
-        # Convert positions to actual word strings
-        words = set()
-        for pos_list in word_positions:
-            word = ''.join(temp_board[r, c] for r, c in pos_list)
-            words.add(word)
-        
-        return words
+        # Every span is a slice of one line: a row of the board for horizontal words
+        # (axis 0), a row of its transposed view for vertical ones
+        lines = (temp_board, temp_board.T)
+        return {cells_text(lines[axis][line, start:end])
+                for axis, line, start, end in self._move_spans(additions).tolist()}
     
     def _check_word_valid(self, additions: List[Tuple[str, List[int]]]) -> bool:
         """
@@ -353,42 +373,34 @@ class Game:
         wildcard_indices = [i for i, (ch, _) in enumerate(additions) if ch == '-']
         
         if not wildcard_indices:
-            # No wildcards, simple dictionary check
+            # No wildcards, simple dictionary check; the superset test runs the lookups
+            # in C and the invalid words are only listed when it fails
             all_words = self._get_all_affected_words(additions)
+            dictionary = self.rule.scrabble_dictionary
+            if dictionary.issuperset(map(str.lower, all_words)):
+                return True
             invalid_words = [word for word in all_words
-                             if word.lower() not in self.rule.scrabble_dictionary]
+                             if word.lower() not in dictionary]
             if len(invalid_words) > 0:
                 raise ValueError(f"Formed invalid words: {', '.join(invalid_words)}. This fuck isn't even fucking English (My husband insisted to add this line. I apologize for his bad manners.)")
             return True
         
         # Wildcards present: exhaustively test all letter combinations
         # Since there are at most 2 wildcards in a standard Scrabble game,
-        # we can afford to test all combinations (max 26^2 = 676 checks)
-        
-        # Generate all possible letter combinations for wildcards
-        
-        all_letter_choices = list(string.ascii_uppercase)
-        valid_combinations = []
-        
-        # Try all combinations of letters for the wildcards
-        for letter_combo in product(all_letter_choices, repeat=len(wildcard_indices)):
-            # Apply this combination to the wildcards
-            for i, wc_idx in enumerate(wildcard_indices):
-                additions[wc_idx] = (letter_combo[i], additions[wc_idx][1])
-            
-            # Check if all formed words are valid with this combination
-            try:
-                all_words = self._get_all_affected_words(additions)
-                if all(word.lower() in self.rule.scrabble_dictionary for word in all_words):
-                    # This combination works! Store it
-                    valid_combinations.append(letter_combo)
-            except:
-                # If word extraction fails, skip this combination
-                pass
-        
-        # Restore wildcards temporarily
-        for wc_idx in wildcard_indices:
-            additions[wc_idx] = ('-', additions[wc_idx][1])
+        # we can afford to test all combinations (max 26^2 = 676 checks).
+        # The valid combinations only depend on the board, the move and the dictionary,
+        # so they are remembered for the current board and reused on repeat checks.
+        # Only an immutable (frozenset) dictionary can be part of the key: a plain set
+        # may be edited or replaced between checks, so those are always resolved afresh
+        dictionary = self.rule.scrabble_dictionary
+        if isinstance(dictionary, frozenset):
+            memo_key = ('wildcards', tuple([(ch, pos[0], pos[1]) for ch, pos in additions]), dictionary)
+            valid_combinations = self._board_memo().get(memo_key)
+            if valid_combinations is None:
+                valid_combinations = self._wildcard_combinations(additions, wildcard_indices)
+                self._board_memo()[memo_key] = valid_combinations
+        else:
+            valid_combinations = self._wildcard_combinations(additions, wildcard_indices)
         
         if not valid_combinations:
             raise ValueError(f"No valid letter combination found for wildcards at positions {[additions[i][1] for i in wildcard_indices]}")
@@ -402,7 +414,246 @@ class Game:
         
         return True
     
+    def _wildcard_combinations(self, additions: List[Tuple[str, List[int]]], wildcard_indices: List[int]) -> List[Tuple[str, ...]]:
+        """
+        Return every letter combination for the wildcards that makes all formed words valid.
+
+        Filling in the wildcards changes letters but not which cells are occupied, so
+        the formed words are extracted once with the wildcards in place, from the
+        spans memoized by _move_spans (which scoring the resolved move reuses). Words without
+        a wildcard are checked once; the others become format templates with one slot
+        per wildcard, and each combination only formats and looks up those strings
+        instead of rebuilding the board and re-extracting the words.
+        """
+        letter_choices = self._wildcard_letter_choices(additions, wildcard_indices)
+        dictionary = self.rule.scrabble_dictionary
+
+        temp_board = self.board.copy()
+        for ch, (row, col) in additions:
+            temp_board[row, col] = ch
+        try:
+            # Same memoized spans as plain validation and scoring use
+            spans = self._move_spans(additions).tolist()
+        except Exception:
+            # If word extraction fails, no combination can be valid
+            return []
+
+        slot_of = {tuple(additions[wc_idx][1]): i for i, wc_idx in enumerate(wildcard_indices)}
+        lines = (temp_board, temp_board.T)
+        templates = []
+        for axis, line, start, end in spans:
+            text = cells_text(lines[axis][line, start:end]).lower()
+            cells = ([(line, p) for p in range(start, end)] if axis == 0
+                     else [(p, line) for p in range(start, end)])
+            slots = [slot_of[cell] for cell in cells if cell in slot_of]
+            if not slots:
+                if text not in dictionary:
+                    return []
+                continue
+            templates.append((text.replace('-', '{}'), slots))
+
+        # With several wildcards in one word (the main word), let the rule list the
+        # letters that complete it rather than trying every combination of choices
+        fill_pattern = getattr(self.rule, 'fill_pattern', None)
+        if fill_pattern is not None and len(wildcard_indices) > 1 and templates:
+            main = max(templates, key=lambda template: len(template[1]))
+            template, slots = main
+            if sorted(slots) == list(range(len(wildcard_indices))):
+                choice_sets = [set(choices) for choices in letter_choices]
+                valid_combinations = []
+                for fill in fill_pattern(template.replace('{}', '_')):
+                    combo = [''] * len(slots)
+                    for slot, letter in zip(slots, fill):
+                        combo[slot] = letter
+                    lower_combo = [letter.lower() for letter in combo]
+                    if (all(letter in choices for letter, choices in zip(combo, choice_sets)) and
+                            all(other.format(*[lower_combo[i] for i in other_slots]) in dictionary
+                                for other, other_slots in templates if other is not template)):
+                        valid_combinations.append(tuple(combo))
+                return sorted(valid_combinations)
+
+        # Try all combinations of the remaining candidate letters for the wildcards
+        valid_combinations = []
+        lower_choices = [[letter.lower() for letter in choices] for choices in letter_choices]
+        for letter_combo in product(*lower_choices):
+            if all(template.format(*[letter_combo[i] for i in slots]) in dictionary
+                   for template, slots in templates):
+                valid_combinations.append(tuple(letter.upper() for letter in letter_combo))
+        return valid_combinations
+
+    def _wildcard_letter_choices(self, additions: List[Tuple[str, List[int]]], wildcard_indices: List[int]) -> List[List[str]]:
+        """
+        Return the candidate letters for each wildcard, pruned by its cross word.
+
+        The tiles of a move lie in one line, so the perpendicular word through a
+        wildcard contains no other new tile. Each wildcard can therefore be checked
+        against its own cross word alone (26 lookups), and only letters that make it
+        a dictionary word are combined. A wildcard without a cross word keeps all
+        letters. Candidates stay in alphabetical order.
+        """
+        all_letters = list(string.ascii_uppercase)
+        temp_board = self.board.copy()
+        for ch, (row, col) in additions:
+            temp_board[row, col] = ch
+        horizontal = all(pos[0] == additions[0][1][0] for _, pos in additions)
+        # Cross words run along the column for a horizontal move, along the row
+        # otherwise; take their extents from the move's memoized spans (keyed by the
+        # line they run along) instead of walking the board from each wildcard
+        cross_axis = 1 if horizontal else 0
+        cross_spans = {line: (start, end)
+                       for axis, line, start, end in self._move_spans(additions).tolist()
+                       if axis == cross_axis}
+        dictionary = self.rule.scrabble_dictionary
+        # Memoized lookup when the rule provides one (see Rule.fill_letters)
+        fill_letters = getattr(self.rule, 'fill_letters', None)
+
+        letter_choices = []
+        for wc_idx in wildcard_indices:
+            row, col = additions[wc_idx][1]
+            line, pos = (col, row) if horizontal else (row, col)
+            if line not in cross_spans:
+                letter_choices.append(all_letters)
+                continue
+            start, end = cross_spans[line]
+            line_cells = temp_board[:, col] if horizontal else temp_board[row]
+            prefix = cells_text(line_cells[start:pos]).lower()
+            suffix = cells_text(line_cells[pos + 1:end]).lower()
+            if '-' in prefix or '-' in suffix:
+                letter_choices.append(all_letters)
+                continue
+            if fill_letters is not None:
+                fits = fill_letters(prefix, suffix)
+                letter_choices.append([letter for letter in all_letters if letter in fits])
+            else:
+                letter_choices.append([letter for letter in all_letters
+                                       if prefix + letter.lower() + suffix in dictionary])
+        return letter_choices
+
+    def _board_memo(self) -> dict:
+        """
+        Return the memo dict for the current board contents.
+
+        Only one board state is remembered: as soon as the contents differ from the
+        ones the memo was filled for, a fresh dict is started. Keying on the contents
+        rather than invalidating in new_move keeps direct board writes safe.
+        """
+        board_bytes = self.board.tobytes()
+        if board_bytes != self._memo_board:
+            self._memo_board = board_bytes
+            self._memo = {}
+        return self._memo
+
+    def _move_spans(self, additions: List[Tuple[str, List[int]]]) -> np.ndarray:
+        """
+        Return the (axis, line, start, end) spans of the words a move forms on the board.
+
+        Spans depend only on which cells end up occupied, not on the letters, so they
+        are memoized for the current board by the move's positions. Validating a move
+        and then scoring it (new_move, the optimisers) finds the words only once, and
+        wildcard letters resolved in between do not matter. The array is read-only.
+        """
+        memo = self._board_memo()
+        key = ('spans', tuple((pos[0], pos[1]) for _, pos in additions))
+        spans = memo.get(key)
+        if spans is None:
+            rows = np.array([pos[0] for _, pos in additions])
+            cols = np.array([pos[1] for _, pos in additions])
+            occupied = self.occupied()
+            occupied[rows, cols] = True
+            spans = move_word_spans(occupied, rows, cols)
+            spans.flags.writeable = False
+            memo[key] = spans
+        return spans
+
     def score_calculator(self, additions: List[Tuple[str, List[int]]], bingo: bool = False) -> int:
+        """
+        Score a move like _score_calculator, memoizing results for the current board.
+
+        Recommenders score many candidate moves against the same board and the same
+        (letter, position) set often comes up more than once, so results are kept in
+        the board memo keyed by the additions' signature. The rule's points and
+        multipliers are assumed fixed for the Game.
+        """
+        memo = self._board_memo()
+        key = ('score', tuple(sorted((ch, pos[0], pos[1]) for ch, pos in additions)), bingo)
+        score = memo.get(key)
+        if score is None:
+            score = self._score_calculator(additions, bingo)
+            memo[key] = score
+        return score
+
+    def _score_tables(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the rule's (letter points, letter multiplier, word multiplier) tables for
+        the scoring kernels.
+
+        Rules that leave out the multiplier grids get the identity grid, and rules that
+        only define the letter_points dict get a table built from it. Everything is
+        handed over as C-contiguous int8 (a no-op for Rule's own tables), so the kernels
+        are only ever compiled for one set of argument types.
+
+        When that conversion leaves the rule's arrays as they are, they are remembered
+        and later calls only check they are still the same objects. Converted copies
+        are never reused, since they would miss in-place edits of the rule's arrays.
+        """
+        # Multiplier grids (fallback to identity if not provided)
+        wm = getattr(self.rule, 'word_multiplier', _ONES_15)
+        lm = getattr(self.rule, 'letter_multiplier', _ONES_15)
+        # Letter points indexed by code point (fallback for rules that only define the dict)
+        points = getattr(self.rule, 'letter_points_arr', None)
+
+        tables = self._tables
+        if tables is not None and tables[0] is points and tables[1] is lm and tables[2] is wm:
+            return tables
+
+        sources = (points, lm, wm)
+        if points is None:
+            points = build_letter_points_table(self.rule.letter_points)
+        tables = (np.ascontiguousarray(points, dtype=np.int8),
+                  np.ascontiguousarray(lm, dtype=np.int8),
+                  np.ascontiguousarray(wm, dtype=np.int8))
+        if all(table is source for table, source in zip(tables, sources)):
+            self._tables = tables
+        return tables
+
+    def score_batch(self, batch_additions: List[List[Tuple[str, List[int]]]]) -> np.ndarray:
+        """
+        Score many candidate moves on the current board in one compiled call.
+
+        Each move follows the _score_calculator conventions and gets the bingo bonus
+        when it places 7 tiles. The moves are packed into a (k, max_tiles, 3) array of
+        (code, row, col) padded with -1 and scored in parallel by score_moves.
+
+        The compiled kernel does no bounds checking, so a move with a tile off the
+        board or a tile that is not a single character is never packed: it scores -1,
+        letting callers skip it as they would a move _score_calculator rejects. An
+        empty move scores 0, as in _score_calculator.
+
+        Returns:
+            Length-k int64 array of scores, in the order of batch_additions.
+        """
+        n_rows, n_cols = self.board.shape
+        max_tiles = max((len(adds) for adds in batch_additions), default=0)
+        moves = np.full((len(batch_additions), max_tiles, 3), -1, dtype=np.int64)
+        scores = np.full(len(batch_additions), -1, dtype=np.int64)
+        packed = []
+        for i, adds in enumerate(batch_additions):
+            try:
+                tiles = [(ord(ch), pos[0], pos[1]) for ch, pos in adds]
+            except (TypeError, ValueError, IndexError):
+                continue
+            if not tiles:
+                scores[i] = 0
+            elif all(0 <= row < n_rows and 0 <= col < n_cols for _, row, col in tiles):
+                moves[i, :len(tiles)] = tiles
+                packed.append(i)
+
+        if packed:
+            points, lm, wm = self._score_tables()
+            scores[packed] = score_moves(self.board_codes(), moves[packed], points, lm, wm)
+        return scores
+
+    def _score_calculator(self, additions: List[Tuple[str, List[int]]], bingo: bool = False) -> int:
         """
         Calculate the total score for a move (main word + any cross words) according to
         Scrabble rules, using the current board and rule multipliers.
@@ -426,48 +677,29 @@ class Game:
         if not additions:
             return 0
 
-        # Track blank positions (lowercase letters indicate a blank set to that letter)
-        blank_positions: Set[Tuple[int, int]] = set()
-        norm_additions: List[Tuple[str, List[int]]] = []
-        for ch, pos in additions:
-            if isinstance(ch, str) and ch.isalpha() and ch.islower():
-                blank_positions.add((pos[0], pos[1]))
-                norm_additions.append((ch.upper(), pos))
-            else:
-                norm_additions.append((ch.upper(), pos))
+        # Build a temporary integer board with the new tiles' code points applied
+        # exactly as given and flagged with NEW_TILE, so no separate mask of new
+        # cells is needed; scoring never needs the string cells. A fresh array is
+        # used on purpose: at 15x15, allocating beats copying into a reused buffer
+        temp_codes = self.board_codes().copy()
+        if len(additions) == 1:
+            # A single tile (the most common continuation) is one scalar write;
+            # index arrays only pay off from two tiles on
+            ch, (row, col) = additions[0]
+            temp_codes[row, col] = ord(ch) | NEW_TILE
+        else:
+            new_rows = np.array([pos[0] for _, pos in additions])
+            new_cols = np.array([pos[1] for _, pos in additions])
+            temp_codes[new_rows, new_cols] = [ord(ch) | NEW_TILE for ch, _ in additions]
 
-        # Build temporary board with the new tiles applied
-        temp_board = self.board.copy()
-        new_positions: Set[Tuple[int, int]] = set()
-        for ch, (r, c) in norm_additions:
-            temp_board[r, c] = ch
-            new_positions.add((r, c))
+        # Main and cross word spans formed by the move, shared with word validation
+        spans = self._move_spans(additions)
 
-        # Use the efficient helper to get word positions
-        word_positions = self._extract_word_positions(temp_board, norm_additions)
+        points, lm, wm = self._score_tables()
 
-        # Multiplier grids (fallback to identity if not provided)
-        wm = getattr(self.rule, 'word_multiplier', np.ones((15, 15), dtype=np.int8))
-        lm = getattr(self.rule, 'letter_multiplier', np.ones((15, 15), dtype=np.int8))
-
-        def score_word(pos_list: List[Tuple[int, int]]) -> int:
-            letter_sum = 0
-            word_mult = 1
-            for (r, c) in pos_list:
-                ch = temp_board[r, c]
-                # Base points: blanks contribute 0, others per letter_points
-                base = 0 if (r, c) in blank_positions else int(self.rule.letter_points.get(ch.upper(), 0))
-                if (r, c) in new_positions:
-                    letter_sum += base * int(lm[r, c])
-                    word_mult *= max(1, int(wm[r, c]))
-                else:
-                    letter_sum += base
-            return letter_sum * word_mult
-
-        total = sum(score_word(w) for w in word_positions)
-        if bingo or len(norm_additions) == 7:
-            total += 50
-        return int(total)
+        # Bingo bonus folded in arithmetically (a bool multiplies as 0 or 1)
+        total = score_words(temp_codes, spans, points, lm, wm)
+        return int(total) + 50 * bool(bingo or len(additions) == 7)
     
     def _update(self, additions: List[Tuple[str, List[int]]]) -> None:
         """
@@ -479,12 +711,11 @@ class Game:
         Assumes:
             The move has already been validated.
         """
-        # Convert letters to uppercase
-        additions = [(letter.upper(), pos) for letter, pos in additions]
-        
-        # Update the board
-        for letter, [row, col] in additions:
-            self.board[row][col] = letter
+        # Write each tile straight into its cell, uppercased, without building a
+        # converted copy of the list first
+        board = self.board
+        for letter, (row, col) in additions:
+            board[row, col] = letter.upper()
             
 
 
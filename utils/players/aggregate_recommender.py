@@ -2,17 +2,20 @@ from utils.matrix.game_state import Game
 from utils.players.longest_word import OptimiserLength
 from utils.players.prized_cells import OptimiserPrize
 from utils.players.crossword import OptimiserCrossword
-import numpy as np
 
 class AggregateRecommender:
     # Aggregates recommendations from multiple optimisers
     def __init__(self, rule, game=None):
         self.rule = rule
         self.game = game if game else Game(rule)
+        # Built once and reused by every recommend_next_move call; the optimisers
+        # keep no per-move state, and the prize and crossword ones share the
+        # length optimiser's helpers instead of each building their own
+        longest_opt = OptimiserLength(rule, self.game)
         self.optimisers = [
-            OptimiserLength(rule, self.game),
-            OptimiserPrize(rule, self.game),
-            OptimiserCrossword(rule, self.game)
+            longest_opt,
+            OptimiserPrize(rule, self.game, longest_opt),
+            OptimiserCrossword(rule, self.game, longest_opt)
         ]
 
     def recommend_next_move(self, deck):
@@ -28,27 +31,23 @@ class AggregateRecommender:
            list if no moves.
 
         Returns:
-            Dict[str, List[Tuple[List[Tuple[str, List[int]]], int]]]
+            Dict[str, List[Move]]
             Keys: 'PrizeCells' (always on empty board), and on non-empty boards also
-            'LongestWord', 'Crossword'. Each value is a list of (additions, score) tuples.
+            'LongestWord', 'Crossword'. Each value is a list of Move (additions, score) tuples.
         """
         # Detect empty board (no placed tiles)
-        board_empty = not np.any(self.game.board != '')
+        board_empty = not self.game.occupied().any()
 
         results = {}
+        longest_opt, prize_opt, cross_opt = self.optimisers
 
         if board_empty:
             # Only run OptimiserPrize per requirement
-            prize_opt = OptimiserPrize(self.rule, self.game)
             prize_moves = prize_opt.recommend_next_move(deck)  # already [(adds, score)]
             results['PrizeCells'] = prize_moves if prize_moves else []
             return results
 
         # Non-empty board: run all three
-        longest_opt = OptimiserLength(self.rule, self.game)
-        prize_opt = OptimiserPrize(self.rule, self.game)
-        cross_opt = OptimiserCrossword(self.rule, self.game)
-
         # Each optimiser already returns only top-scoring moves as (adds, score) tuples
         longest_moves = longest_opt.recommend_next_move(deck)
         prize_moves = prize_opt.recommend_next_move(deck)
@@ -2,7 +2,7 @@ from utils.linear.simple_pattern_generator import SimplePatternGenerator
 from utils.linear.dynamic_pattern_generator import DynamicPatternGenerator
 from utils.matrix.game_state import Game
 from utils.players.longest_word import OptimiserLength
-import numpy as np
+from utils.players.move import Move
 
 from collections import Counter
 
@@ -26,97 +26,34 @@ class OptimiserCrossword:
           materialize additions, validate legality, score, and return the highest-scoring
           move(s) with ties preserved. Blanks handled the same as longest_word.
 
-        Returns: List[List[(ch, [r,c])]] best scoring additions (ties), or [] if none
+        Returns: List[Move] (additions, score) for the best scoring moves (ties), or [] if none
         """
-        board = self.game.board
+        occ = self.game.occupied()
         # If empty board, do nothing
-        if np.sum(board != '') == 0:
+        if not occ.any():
             return []
 
         # Normalize deck
         deck_up = [d.upper() for d in deck]
         deck_base = ''.join(deck_up)
 
-        anchors = self.ol._find_anchor_positions()
+        anchors = self.ol._find_anchor_positions(occ)
         if not anchors:
             return []
 
         candidates = []
-        seen_adds = set()  # dedup additions early to avoid rescoring
+        seen_adds = set()  # dedup additions early to avoid revalidating and rescoring
 
-        rows, cols = board.shape
+        # Neighbor presence for every cell at once, as nested lists for cheap lookups
+        vert_mask, horiz_mask = (mask.tolist() for mask in self.ol._neighbour_masks(occ))
 
         for (r, c) in anchors:
-            # Determine neighbor presence
-            has_vert_neighbor = ((r > 0 and board[r-1, c] != '') or (r < rows-1 and board[r+1, c] != ''))
-            has_horiz_neighbor = ((c > 0 and board[r, c-1] != '') or (c < cols-1 and board[r, c+1] != ''))
-
             # If vertical neighbor -> place horizontally to form a cross
-            if has_vert_neighbor:
-                try:
-                    h_patterns = self.ol._build_all_dynamic_patterns(deck_up, (r, c), axis='H')
-                except Exception:
-                    h_patterns = []
-                for pattern, fixed_letters, meta in h_patterns:
-                    deck_for_pattern = deck_base + fixed_letters
-                    try:
-                        words = self.dpg.generate(pattern, deck_for_pattern, self.rule.scrabble_dictionary)
-                    except Exception:
-                        words = []
-                    if not words:
-                        continue
-                    adds_lists = self.ol._materialize_additions_from_words('H', (r, c), words, meta, deck_base)
-                    if not adds_lists:
-                        continue
-                    for adds in adds_lists:
-                        # Validate crossword legality
-                        try:
-                            if not self.game._check_word_valid(adds):
-                                continue
-                        except Exception:
-                            continue
-                        key = tuple((ch, pos[0], pos[1]) for ch, pos in adds)
-                        if key in seen_adds:
-                            continue
-                        seen_adds.add(key)
-                        try:
-                            score = self.game.score_calculator(adds)
-                        except Exception:
-                            continue
-                        candidates.append((score, adds))
-
+            if vert_mask[r][c]:
+                self._process_axis((r, c), 'H', deck_up, deck_base, seen_adds, candidates)
             # If horizontal neighbor -> place vertically to form a cross
-            if has_horiz_neighbor:
-                try:
-                    v_patterns = self.ol._build_all_dynamic_patterns(deck_up, (r, c), axis='V')
-                except Exception:
-                    v_patterns = []
-                for pattern, fixed_letters, meta in v_patterns:
-                    deck_for_pattern = deck_base + fixed_letters
-                    try:
-                        words = self.dpg.generate(pattern, deck_for_pattern, self.rule.scrabble_dictionary)
-                    except Exception:
-                        words = []
-                    if not words:
-                        continue
-                    adds_lists = self.ol._materialize_additions_from_words('V', (r, c), words, meta, deck_base)
-                    if not adds_lists:
-                        continue
-                    for adds in adds_lists:
-                        try:
-                            if not self.game._check_word_valid(adds):
-                                continue
-                        except Exception:
-                            continue
-                        key = tuple((ch, pos[0], pos[1]) for ch, pos in adds)
-                        if key in seen_adds:
-                            continue
-                        seen_adds.add(key)
-                        try:
-                            score = self.game.score_calculator(adds)
-                        except Exception:
-                            continue
-                        candidates.append((score, adds))
+            if horiz_mask[r][c]:
+                self._process_axis((r, c), 'V', deck_up, deck_base, seen_adds, candidates)
 
         if not candidates:
             return []
@@ -127,5 +64,48 @@ class OptimiserCrossword:
         best_adds = [adds for adds, s in best]
         deduped_adds = self.ol._dedup_additions_sets(best_adds)
         # Rebuild tuples with scores after dedup
-        best = [(adds, max_score) for adds in deduped_adds]
-        return best
\ No newline at end of file
+        best = [Move(adds, max_score) for adds in deduped_adds]
+        return best
+
+    def _process_axis(self, anchor, axis, deck_up, deck_base, seen_adds, candidates):
+        """
+        Generate, validate and score the placements through anchor along axis ('H' or 'V').
+
+        Appends (score, additions) to candidates for every valid placement not already
+        in seen_adds, and records each placement's key there.
+        """
+        try:
+            patterns = self.ol._build_all_dynamic_patterns(deck_up, anchor, axis=axis)
+        except Exception:
+            patterns = []
+        for pattern, fixed_letters, meta in patterns:
+            deck_for_pattern = deck_base + fixed_letters
+            try:
+                words = self.dpg.generate(pattern, deck_for_pattern, self.rule.scrabble_dictionary)
+            except Exception:
+                words = []
+            if not words:
+                continue
+            adds_lists = self.ol._materialize_additions_from_words(axis, anchor, words, meta, deck_base)
+            if not adds_lists:
+                continue
+            for adds in adds_lists:
+                # Skip placements already reached from another anchor or pattern
+                # before validating them again; a repeat is valid exactly when its
+                # first occurrence was. The key is built from a list, which tuple()
+                # consumes faster than a generator
+                key = tuple([(ch, pos[0], pos[1]) for ch, pos in adds])
+                if key in seen_adds:
+                    continue
+                seen_adds.add(key)
+                # Validate crossword legality
+                try:
+                    if not self.game._check_word_valid(adds):
+                        continue
+                except Exception:
+                    continue
+                try:
+                    score = self.game.score_calculator(adds)
+                except Exception:
+                    continue
+                candidates.append((score, adds))
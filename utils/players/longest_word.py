@@ -1,9 +1,11 @@
 from utils.linear.simple_pattern_generator import SimplePatternGenerator
 from utils.linear.dynamic_pattern_generator import DynamicPatternGenerator
 from utils.matrix.game_state import Game
+from utils.players.move import Move
 
 import numpy as np
 from collections import Counter
+from bisect import bisect_left, bisect_right
 
 class OptimiserLength:
     # recommendations based on longest possible words from current deck and board
@@ -93,17 +95,16 @@ class OptimiserLength:
 
         Returns:
             If empty board: List[str] of start words (longest-first logic in _find_start_word)
-            Else: List[List[Tuple[str, [int,int]]]] additions for the highest-scoring move(s) among the longest possible words formed.
+            Else: List[Move] (additions, score) for the highest-scoring move(s) among the longest possible words formed.
         """
 
-        board = self.game.board
-
         # Empty board check
-        if np.sum(board != '') == 0:
+        occ = self.game.occupied()
+        if not occ.any():
             return self._find_start_word(deck, len(deck))
 
         # Find all anchors (empty cells that touch any occupied cell orthogonally)
-        anchors = self._find_anchor_positions()
+        anchors = self._find_anchor_positions(occ)
 
         # Collect candidate additions (filtered per-pattern by longest words)
         candidates = []
@@ -139,7 +140,7 @@ class OptimiserLength:
                         try:
                             # Validate cross-words and dictionary before accepting
                             if self.game._check_word_valid(adds):
-                                key = tuple((ch, pos[0], pos[1]) for ch, pos in adds)
+                                key = tuple([(ch, pos[0], pos[1]) for ch, pos in adds])
                                 if key not in seen_additions:
                                     seen_additions.add(key)
                                     candidates.append(adds)
@@ -175,7 +176,7 @@ class OptimiserLength:
                     for adds in additions_sets:
                         try:
                             if self.game._check_word_valid(adds):
-                                key = tuple((ch, pos[0], pos[1]) for ch, pos in adds)
+                                key = tuple([(ch, pos[0], pos[1]) for ch, pos in adds])
                                 if key not in seen_additions:
                                     seen_additions.add(key)
                                     candidates.append(adds)
@@ -188,23 +189,13 @@ class OptimiserLength:
         if not candidates:
             return []
 
-        # Score all candidates using Game.score_calculator on the provided board
-        game = self.game
-
-        scored = []
-        max_score = None
-        for adds in candidates:
-            try:
-                score = game.score_calculator(adds)
-            except Exception:
-                # If scoring fails for any reason, skip this candidate
-                continue
-            scored.append((score, adds))
-            if max_score is None or score > max_score:
-                max_score = score
-
+        # Score all candidates in one batched call on the provided board, skipping
+        # any the batch scorer rejects (scored -1)
+        scores = self.game.score_batch(candidates)
+        scored = [(score, adds) for score, adds in zip(scores.tolist(), candidates) if score >= 0]
         if not scored:
             return []
+        max_score = max(score for score, _ in scored)
 
         # Return only the highest-scoring additions (preserve ties)
         best = [(adds, score) for score, adds in scored if score == max_score]
@@ -212,26 +203,34 @@ class OptimiserLength:
         best_adds = [adds for adds, score in best]
         deduped_adds = self._dedup_additions_sets(best_adds)
         # Rebuild tuples with scores after dedup
-        best = [(adds, score) for score, adds in scored if score == max_score and adds in deduped_adds]
+        best = [Move(adds, score) for score, adds in scored if score == max_score and adds in deduped_adds]
         return best
 
-    def _find_anchor_positions(self):
+    @staticmethod
+    def _neighbour_masks(occ):
+        """
+        Return (vertical, horizontal) boolean masks of the cells whose neighbour above
+        or below, respectively left or right, is occupied in occ.
+        """
+        # Orthogonal neighbor occupancy via shifted slices
+        vertical = np.zeros_like(occ)
+        vertical[1:, :] = occ[:-1, :]
+        vertical[:-1, :] |= occ[1:, :]
+        horizontal = np.zeros_like(occ)
+        horizontal[:, 1:] = occ[:, :-1]
+        horizontal[:, :-1] |= occ[:, 1:]
+        return vertical, horizontal
+
+    def _find_anchor_positions(self, occ=None):
         """
         Return list of (r,c) empty cells that are adjacent (orthogonally) to any occupied cell.
+
+        occ is the board's occupancy mask if the caller already has it.
         """
-        board = self.game.board
-        # Occupied mask
-        occ = (board != '')
-        # Orthogonal neighbor occupancy via shifts
-        up = np.zeros_like(occ)
-        up[1:, :] = occ[:-1, :]
-        down = np.zeros_like(occ)
-        down[:-1, :] = occ[1:, :]
-        left = np.zeros_like(occ)
-        left[:, 1:] = occ[:, :-1]
-        right = np.zeros_like(occ)
-        right[:, :-1] = occ[:, 1:]
-        neighbor = up | down | left | right
+        if occ is None:
+            occ = self.game.occupied()
+        vertical, horizontal = self._neighbour_masks(occ)
+        neighbor = vertical | horizontal
         # Anchors are empty cells that have any occupied neighbor
         anchors_mask = (~occ) & neighbor
         coords = np.argwhere(anchors_mask)
@@ -242,7 +241,6 @@ class OptimiserLength:
         Scan one direction from anchor to collect ALL reachable blocks and gaps.
         
         Args:
-            board: game board
             anchor: (r, c) anchor position
             axis: 'H' or 'V'
             direction: 'left' or 'right'
@@ -251,102 +249,53 @@ class OptimiserLength:
         Returns:
             (blocks, gaps, tail_max) where blocks/gaps are near-to-far lists
         """
-        board = self.game.board
         r, c = anchor
-        rows, cols = board.shape
-        
         if axis == 'H':
-            if direction == 'left':
-                get_cell = lambda j: board[r, j]
-                max_index = cols
-                start_idx = c - 1
-                step = -1
-                reverse_block = True
-            else:  # right
-                get_cell = lambda j: board[r, j]
-                max_index = cols
-                start_idx = c + 1
-                step = +1
-                reverse_block = False
+            line_index, pos = r, c
         else:  # axis == 'V'
-            if direction == 'left':  # up
-                get_cell = lambda i: board[i, c]
-                max_index = rows
-                start_idx = r - 1
-                step = -1
-                reverse_block = True
-            else:  # down
-                get_cell = lambda i: board[i, c]
-                max_index = rows
-                start_idx = r + 1
-                step = +1
-                reverse_block = False
-        
+            line_index, pos = c, r
+        line_len = self.game.board.shape[1] if axis == 'H' else self.game.board.shape[0]
+
+        # Blocks of the whole line (cached by Game); select the ones on this side of the
+        # anchor and express them as (near, far) distances from the anchor
+        starts, ends, texts = self.game.line_blocks(axis, line_index)
+        side = []
+        if direction == 'left':
+            for i in range(bisect_left(starts, pos) - 1, -1, -1):
+                end = min(ends[i], pos)
+                text = texts[i][:end - starts[i]]
+                side.append((pos - end + 1, pos - starts[i], text))
+            boundary = pos + 1
+        else:  # right
+            for i in range(bisect_right(ends, pos + 1), len(starts)):
+                start = max(starts[i], pos + 1)
+                text = texts[i][start - starts[i]:]
+                side.append((start - pos, ends[i] - 1 - pos, text))
+            boundary = line_len - pos
+
         blocks = []
         gaps = []
         tail_max = 0
-        j = start_idx
         cumulative_distance = 1  # anchor takes 1 letter
-        
-        # First gap
-        k = 0
-        while 0 <= j < max_index and get_cell(j) == '':
-            k += 1
-            j += step
-        
-        if not (0 <= j < max_index):
-            # Only empties, no blocks
-            tail_max = min(k, rack_len - 1)
-            return blocks, gaps, tail_max
-        
-        # Found first block - check reachability
-        cumulative_distance += k
-        if cumulative_distance > rack_len:
-            # First block unreachable
-            tail_max = min(k, rack_len - 1)
-            return blocks, gaps, tail_max
-        
-        # First block is reachable
-        gaps.append(k)
-        blk = []
-        while 0 <= j < max_index and get_cell(j) != '':
-            blk.append(get_cell(j).upper())
-            j += step
-        if reverse_block:
-            blk.reverse()
-        blocks.append(''.join(blk))
-        
-        # Continue scanning for more blocks
-        while 0 <= j < max_index:
-            k = 0
-            while 0 <= j < max_index and get_cell(j) == '':
-                k += 1
-                j += step
-            
-            if not (0 <= j < max_index):
-                # Reached boundary
+        prev_far = 0  # distance of the last cell consumed (the anchor itself)
+
+        for near, far, text in side:
+            k = near - prev_far - 1
+            if cumulative_distance + k > rack_len:
+                # Next block unreachable: tail can use the gap up to the remaining rack
                 remaining = rack_len - cumulative_distance
                 tail_max = min(k, remaining) if remaining > 0 else 0
-                break
-            
-            # Check next block reachability
+                return blocks, gaps, tail_max
+            # Block is reachable
             cumulative_distance += k
-            if cumulative_distance > rack_len:
-                # Next block unreachable
-                remaining = rack_len - (cumulative_distance - k)
-                tail_max = min(k, remaining) if remaining > 0 else 0
-                break
-            
-            # Next block is reachable
             gaps.append(k)
-            blk = []
-            while 0 <= j < max_index and get_cell(j) != '':
-                blk.append(get_cell(j).upper())
-                j += step
-            if reverse_block:
-                blk.reverse()
-            blocks.append(''.join(blk))
-        
+            blocks.append(text)
+            prev_far = far
+
+        # Reached the board boundary after the last reachable block
+        k = boundary - prev_far - 1
+        remaining = rack_len - cumulative_distance
+        tail_max = min(k, remaining) if remaining > 0 else 0
         return blocks, gaps, tail_max
 
     def _build_pattern_from_selection(self, left_blocks, left_gaps, left_tail, 
@@ -596,8 +545,11 @@ class OptimiserLength:
 
         Returns list[List[Tuple[str, [int,int]]]]
         """
-        board = self.game.board
         (r, c) = anchor
+        # Cells of the anchor's line as plain uppercase strings ('' when empty), read
+        # once instead of indexing NumPy scalars for every letter of every word
+        line = self.game.board[r] if axis == 'H' else self.game.board[:, c]
+        cells = [cell.upper() for cell in line.tolist()]
 
         results = []
         seen = set()
@@ -626,10 +578,10 @@ class OptimiserLength:
                         break
                     
                     # Check board position
-                    if board[r, col] == '':
+                    if cells[col] == '':
                         # Empty - need to place this letter
                         additions.append((ch, [r, col]))
-                    elif board[r, col].upper() == ch:
+                    elif cells[col] == ch:
                         # Already occupied with correct letter - skip
                         pass
                     else:
@@ -647,10 +599,10 @@ class OptimiserLength:
                         break
                     
                     # Check board position
-                    if board[row, c] == '':
+                    if cells[row] == '':
                         # Empty - need to place this letter
                         additions.append((ch, [row, c]))
-                    elif board[row, c].upper() == ch:
+                    elif cells[row] == ch:
                         # Already occupied with correct letter - skip
                         pass
                     else:
@@ -682,7 +634,7 @@ class OptimiserLength:
                 continue
 
             # Deduplicate
-            key = tuple((ch, pos[0], pos[1]) for ch, pos in normalized_additions)
+            key = tuple([(ch, pos[0], pos[1]) for ch, pos in normalized_additions])
             if key in seen:
                 continue
             seen.add(key)
@@ -0,0 +1,23 @@
+from operator import itemgetter
+from typing import List, NamedTuple, Tuple
+
+
+class Move(NamedTuple):
+    """
+    A recommended move returned by the optimisers.
+
+    Being a NamedTuple it still unpacks as the (additions, score) pair callers
+    have always received, while letting them name the fields instead.
+    """
+    additions: List[Tuple[str, List[int]]]  # (letter, [row, col]) for each new tile
+    score: int
+
+    @property
+    def positions(self) -> List[Tuple[int, int]]:
+        """(row, col) of each new tile in board order."""
+        return sorted((pos[0], pos[1]) for _, pos in self.additions)
+
+    @property
+    def word(self) -> str:
+        """The new tiles' letters in board order, uppercased."""
+        return ''.join(ch for ch, _ in sorted(self.additions, key=itemgetter(1))).upper()
@@ -2,7 +2,7 @@ from utils.linear.simple_pattern_generator import SimplePatternGenerator
 from utils.linear.dynamic_pattern_generator import DynamicPatternGenerator
 from utils.matrix.game_state import Game
 from utils.players.longest_word import OptimiserLength
-import numpy as np
+from utils.players.move import Move
 
 from collections import Counter
 
@@ -18,8 +18,7 @@ class OptimiserPrize:
 
     def _is_prized_cell(self, r, c):
         """Return True if the empty cell (r,c) is a prized square (multiplier > 1)."""
-        board = self.game.board
-        if board[r, c] != '':
+        if self.game.board_codes()[r, c] != 0:
             return False
         return (self.rule.word_multiplier[r, c] > 1) or (self.rule.letter_multiplier[r, c] > 1)
 
@@ -45,13 +44,13 @@ class OptimiserPrize:
         """
         deck = [d.upper() for d in deck]
         deck_len = len(deck)
-        board = self.game.board
 
         # Determine anchors
-        if np.sum(board != '') == 0:
+        occ = self.game.occupied()
+        if not occ.any():
             anchors = [(7, 7)]  # center anchor for empty board
         else:
-            anchors = self.ol._find_anchor_positions()
+            anchors = self.ol._find_anchor_positions(occ)
         if not anchors:
             return []
 
@@ -89,16 +88,17 @@ class OptimiserPrize:
                         # Require at least one prized cell among new placements
                         if not any(self._is_prized_cell(pos[0], pos[1]) for ch, pos in adds):
                             continue
+                        # Deduplicate before validating: a repeat is valid exactly
+                        # when its first occurrence was
+                        key = tuple([(ch, p[0], p[1]) for ch, p in adds])
+                        if key in seen:
+                            continue
+                        seen.add(key)
                         # Validate move legality (cross words etc.)
                         try:
                             self.game._check_word_valid(adds)
                         except Exception:
                             continue
-                        # Deduplicate key
-                        key = tuple((ch, p[0], p[1]) for ch, p in adds)
-                        if key in seen:
-                            continue
-                        seen.add(key)
                         # Score
                         try:
                             score = self.game.score_calculator(adds)
@@ -115,6 +115,6 @@ class OptimiserPrize:
         best_adds = [adds for adds, score in best]
         deduped_adds = self.ol._dedup_additions_sets(best_adds)
         # Rebuild tuples with scores after dedup
-        best = [(adds, max_score) for adds in deduped_adds]
+        best = [Move(adds, max_score) for adds in deduped_adds]
         return best
     
\ No newline at end of file